@@ -306,9 +306,19 @@ class VFHAlgorithm(BaseAlgorithm):
         
         # Check cells around current position
         scan_radius = 5
+        row_start = max(0, row - scan_radius)
+        row_end = min(self.costmap.grid_height, row + scan_radius + 1)
+        col_start = max(0, col - scan_radius)
+        col_end = min(self.costmap.grid_width, col + scan_radius + 1)
         
-        for r in range(max(0, row - scan_radius), min(self.costmap.grid_height, row + scan_radius + 1)):
-            for c in range(max(0, col - scan_radius), min(self.costmap.grid_width, col + scan_radius + 1)):
+        # Open space: the bit-packed grid answers without visiting each cell
+        if not self.costmap.region_has_obstacle(row_start, row_end, col_start, col_end):
+            return histogram
+        
+        for r in range(row_start, row_end):
+            if not self.costmap.row_has_obstacle(r):
+                continue
+            for c in range(col_start, col_end):
                 if self.costmap.get_cell(r, c) != 0:  # Obstacle
                     # Calculate angle to obstacle
                     dy = r - row
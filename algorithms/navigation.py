@@ -11,8 +11,32 @@ This module implements various path planning algorithms:
 import random
 import math
 import heapq
+from collections import deque
 from .base_algorithm import BaseAlgorithm
 
+
+def _trace_path(parent, idx, width):
+    """
+    Rebuild a path from a flat parent table.
+    
+    Args:
+        parent (list): Parent flat index for each visited cell (start points to itself)
+        idx (int): Flat index of the last cell in the path
+        width (int): Grid width used to flatten (row, col)
+        
+    Returns:
+        list: Positions (row, col) from start to idx
+    """
+    path = []
+    while True:
+        path.append(divmod(idx, width))
+        if parent[idx] == idx:
+            break
+        idx = parent[idx]
+    path.reverse()
+    return path
+
+
 class AStarAlgorithm(BaseAlgorithm):
     """
     A* algorithm implementation for path planning.
@@ -452,41 +476,46 @@ class BFSAlgorithm(BaseAlgorithm):
             print("Goal position is an obstacle. Cannot plan path.")
             return
         
-        # Initialize queue and visited set
-        queue = [(start, [start])]  # (position, path)
-        visited = {start}
+        # ค้นหาบน flat index ของ grid แทน tuple และเก็บ parent แทนการคัดลอก path ทุกโหนด
+        width = self.costmap.grid_width
+        height = self.costmap.grid_height
+        cells = self.costmap.grid_flat.tobytes()
+        start_idx = start[0] * width + start[1]
+        goal_idx = goal[0] * width + goal[1]
+        
+        # Initialize queue and parent table (-1 = not visited)
+        parent = [-1] * (width * height)
+        parent[start_idx] = start_idx
+        queue = deque([start_idx])
         
         # BFS loop
         while queue:
-            current, path = queue.pop(0)
+            current = queue.popleft()
             
             # Check if goal is reached
-            if current == goal:
-                self.path = path[1:]  # Skip start position
+            if current == goal_idx:
+                self.path = _trace_path(parent, current, width)[1:]  # Skip start position
                 self.costmap.set_path(self.path)
                 print(f"BFS path planned with {len(self.path)} steps")
                 return
             
             # Get neighbors
-            for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # Right, Down, Left, Up
-                neighbor_row = current[0] + dr
-                neighbor_col = current[1] + dc
-                neighbor = (neighbor_row, neighbor_col)
+            row, col = divmod(current, width)
+            for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)):  # Right, Down, Left, Up
+                neighbor_row = row + dr
+                neighbor_col = col + dc
                 
-                # Skip invalid or visited positions
-                if not (0 <= neighbor_row < self.costmap.grid_height and 
-                        0 <= neighbor_col < self.costmap.grid_width):
+                # Skip invalid, visited or occupied positions
+                if not (0 <= neighbor_row < height and 0 <= neighbor_col < width):
                     continue
                     
-                if neighbor in visited:
-                    continue
-                    
-                if self.costmap.get_cell(neighbor_row, neighbor_col) != 0:  # Not free
+                neighbor = neighbor_row * width + neighbor_col
+                if parent[neighbor] != -1 or cells[neighbor]:
                     continue
                 
-                # Add to queue and visited set
-                queue.append((neighbor, path + [neighbor]))
-                visited.add(neighbor)
+                # Add to queue and mark visited
+                parent[neighbor] = current
+                queue.append(neighbor)
         
         print("BFS algorithm: No path found")
 
@@ -510,41 +539,46 @@ class DFSAlgorithm(BaseAlgorithm):
             print("Goal position is an obstacle. Cannot plan path.")
             return
         
-        # Initialize stack and visited set
-        stack = [(start, [start])]  # (position, path)
-        visited = {start}
+        # ค้นหาบน flat index ของ grid แทน tuple และเก็บ parent แทนการคัดลอก path ทุกโหนด
+        width = self.costmap.grid_width
+        height = self.costmap.grid_height
+        cells = self.costmap.grid_flat.tobytes()
+        start_idx = start[0] * width + start[1]
+        goal_idx = goal[0] * width + goal[1]
+        
+        # Initialize stack and parent table (-1 = not visited)
+        parent = [-1] * (width * height)
+        parent[start_idx] = start_idx
+        stack = [start_idx]
         
         # DFS loop
         while stack:
-            current, path = stack.pop()
+            current = stack.pop()
             
             # Check if goal is reached
-            if current == goal:
-                self.path = path[1:]  # Skip start position
+            if current == goal_idx:
+                self.path = _trace_path(parent, current, width)[1:]  # Skip start position
                 self.costmap.set_path(self.path)
                 print(f"DFS path planned with {len(self.path)} steps")
                 return
             
             # Get neighbors (in reverse order for DFS)
-            for dr, dc in [(-1, 0), (0, -1), (1, 0), (0, 1)]:  # Up, Left, Down, Right
-                neighbor_row = current[0] + dr
-                neighbor_col = current[1] + dc
-                neighbor = (neighbor_row, neighbor_col)
+            row, col = divmod(current, width)
+            for dr, dc in ((-1, 0), (0, -1), (1, 0), (0, 1)):  # Up, Left, Down, Right
+                neighbor_row = row + dr
+                neighbor_col = col + dc
                 
-                # Skip invalid or visited positions
-                if not (0 <= neighbor_row < self.costmap.grid_height and 
-                        0 <= neighbor_col < self.costmap.grid_width):
+                # Skip invalid, visited or occupied positions
+                if not (0 <= neighbor_row < height and 0 <= neighbor_col < width):
                     continue
                     
-                if neighbor in visited:
-                    continue
-                    
-                if self.costmap.get_cell(neighbor_row, neighbor_col) != 0:  # Not free
+                neighbor = neighbor_row * width + neighbor_col
+                if parent[neighbor] != -1 or cells[neighbor]:
                     continue
                 
-                # Add to stack and visited set
-                stack.append((neighbor, path + [neighbor]))
-                visited.add(neighbor)
+                # Add to stack and mark visited
+                parent[neighbor] = current
+                stack.append(neighbor)
         
         print("DFS algorithm: No path found")
 
@@ -33,8 +33,9 @@ class Card:
         self.__window_width, self.__window_height = Config.get_window_dimensions()
         
         # Card dimensions
-        self.__width, self.__height = Config.get_card_dimensions(self.__window_width)
-        self.__border_radius = Config.get_card_border_radius(self.__width)
+        layout = Config.compute_layout(self.__window_width)
+        self.__width, self.__height = layout.card_width, layout.card_height
+        self.__border_radius = layout.border_radius
         
         # Set up positions
         self.__position = (0, 0)  # Start at origin
@@ -78,6 +79,8 @@ class Card:
                 original_image = pygame.image.load(image_path)
                 self.__image = pygame.transform.scale(
                     original_image, (self.__width, self.__height))
+                if pygame.display.get_surface() is not None:
+                    self.__image = self.__image.convert_alpha()
             except pygame.error:
                 self.__create_placeholder()
         else:
@@ -95,8 +98,8 @@ class Card:
     def __create_shadow(self):
         """Create a shadow surface for the card."""
         shadow_settings = Config.get_shadow_settings()
-        offset = shadow_settings['offset']
-        opacity = shadow_settings['opacity']
+        offset = shadow_settings.offset
+        opacity = shadow_settings.opacity
         
         self.__shadow = pygame.Surface(
             (self.__width + offset*2, self.__height + offset*2), 
@@ -642,6 +645,11 @@ class Card:
         """Get the card's animation progress."""
         return self.__animation_progress
 
+    @property
+    def from_preview(self):
+        """Check if the card is animating out of preview mode."""
+        return self.__from_preview
+
     @property
     def rect(self):
         """Get the card's rectangle."""
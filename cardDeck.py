@@ -5,6 +5,14 @@ from card import Card
 from config import Config
 from state import GameState  # เพิ่มการนำเข้า GameState
 
+# Constants checked for every event, bound once to skip the pygame attribute lookups
+_KEYDOWN = pygame.KEYDOWN
+_MOUSEMOTION = pygame.MOUSEMOTION
+_MOUSEBUTTONDOWN = pygame.MOUSEBUTTONDOWN
+_MOUSEBUTTONUP = pygame.MOUSEBUTTONUP
+
+# Click-path diagnostics go through the level-filtered logger (quiet at the default LOG_LEVEL)
+_log = Config.logger_for("CardDeck")
 
 class CardDeck:
     """Class to manage a collection of cards."""
@@ -29,6 +37,9 @@ class CardDeck:
         # Game stage state (variable to track if we're in game mode)
         self.__in_game_stage = False
         
+        # Card currently being dragged (None when no card is dragged)
+        self.__dragging_card = None
+        
         # Debug-related variables
         debug_settings = Config.get_debug_settings()
         self.__show_hitbox = False
@@ -184,17 +195,22 @@ class CardDeck:
                 
         return total_new_cards > 0  # Return True if new cards were added
     
-    def handle_events(self, events):
+    def handle_events(self, events, camera_y_offset=0):
         """Handle pygame events for the card deck.
         
         Args:
             events (list): List of pygame events
+            camera_y_offset (int): Camera y position subtracted from mouse positions
         """
         debug_settings = Config.get_debug_settings()
         
         for event in events:
+            # Mouse motion is by far the most frequent event, so test it first
+            if event.type == _MOUSEMOTION:
+                self.__handle_mouse_motion((event.pos[0], event.pos[1] - camera_y_offset))
+            
             # Toggle preview mode with spacebar (only if not in game stage)
-            if event.type == pygame.KEYDOWN:
+            elif event.type == _KEYDOWN:
                 if event.key == pygame.K_SPACE and not self.__in_game_stage:
                     self.__toggle_preview_mode()
                 elif event.key == pygame.K_1 and debug_settings['enabled']:
@@ -205,20 +221,16 @@ class CardDeck:
                     self.__show_mouse_position = not self.__show_mouse_position
             
             # Handle mouse events
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                self.__handle_mouse_down(event.pos)
-            
-            elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-                # ถ้ามีการปล่อยเมาส์ ให้หยุดการ drag ทุกใบ
-                for card in self.cards:
-                    if card.dragging:
-                        print(f"[CardDeck] Stopping dragging for card: {card.card_name}")
-                        self.__handle_mouse_up()
-                        # การเรียก handle_card_placement จะจัดการการวาง card ในสถานที่ที่เหมาะสม
-                        # ถ้าวางไม่ได้ การ์ดจะถูกส่งกลับไปยังตำแหน่งเดิม
-            
-            elif event.type == pygame.MOUSEMOTION:
-                self.__handle_mouse_motion(event.pos)
+            elif event.type == _MOUSEBUTTONDOWN and event.button == 1:
+                self.__handle_mouse_down((event.pos[0], event.pos[1] - camera_y_offset))
+            
+            elif event.type == _MOUSEBUTTONUP and event.button == 1:
+                # ถ้ามีการปล่อยเมาส์ ให้หยุดการ drag การ์ดที่กำลังลากอยู่
+                if self.__dragging_card is not None:
+                    _log(f"Stopping dragging for card: {self.__dragging_card.card_name}", level=3)
+                    self.__handle_mouse_up()
+                    # การเรียก handle_card_placement จะจัดการการวาง card ในสถานที่ที่เหมาะสม
+                    # ถ้าวางไม่ได้ การ์ดจะถูกส่งกลับไปยังตำแหน่งเดิม
 
     def force_stop_dragging_all_cards(self):
         """บังคับให้ทุกการ์ดที่กำลังลากอยู่หยุดลาก"""
@@ -228,6 +240,7 @@ class CardDeck:
                 print(f"[CardDeck] Force stop dragging for card: {card.card_name}")
                 card.stop_dragging(reset_position=True)
                 has_dragging_cards = True
+        self.__dragging_card = None
         
         return has_dragging_cards
 
@@ -278,21 +291,22 @@ class CardDeck:
     
     def __handle_mouse_down(self, pos):
         """Handle mouse button down event."""
-        print(f"\n[Mouse Down] at position: {pos}")
+        _log(f"Mouse down at position: {pos}", level=3)
         
         if self.__preview_mode:
-            print("[Preview Mode] Checking for card click...")
+            _log("Preview mode: checking for card click...", level=3)
             deck_cards = [card for card in self.__cards if card.current_area == "deck"]
             
             for i, card in enumerate(deck_cards):
                 if card.is_in_preview_area(pos, len(deck_cards)):
-                    print(f"[Preview Mode] Card clicked: {card.card_type} - {card.card_name}")
+                    _log(f"Preview mode: card clicked: {card.card_type} - {card.card_name}", level=3)
                     preview_data = card._Card__calculate_preview_position(len(deck_cards))
                     preview_pos = preview_data['pos']
                     
                     # Store initial position for animation
                     card.start_dragging_from_preview(pos, preview_pos)
                     card.update_dragging(pos)
+                    self.__dragging_card = card
                     
                     # Close preview mode but keep current dragging card
                     self.__preview_mode = False
@@ -305,55 +319,54 @@ class CardDeck:
                             
                     break
         else:
-            print("[Normal Mode] Checking for card click...")
+            _log("Normal mode: checking for card click...", level=3)
             # Check cards placed on the table (loop through cards instead of using __placed_cards)
             for card in self.__cards:
                 if card.current_area in ["Navigation", "Collision avoidance", "Recovery"] and card.contains_point(pos):
-                    print(f"[Normal Mode] Card clicked: {card.card_type} - {card.card_name} in {card.current_area}")
+                    _log(f"Normal mode: card clicked: {card.card_type} - {card.card_name} in {card.current_area}", level=3)
                     card.start_dragging(pos)
+                    self.__dragging_card = card
                     break
     
     def __handle_mouse_up(self):
         """Handle mouse button up event."""
-        print("\n[Mouse Up] Checking for card placement...")
-        for card in self.__cards:
-            if card.dragging:
-                print(f"[Card Placement] Attempting to place card: {card.card_type} - {card.card_name}")
-                print(f"[Card Placement] Current position: {card.position}")
-                print(f"[Card Placement] Current area: {card.current_area}")
-                print(f"[Card Placement] Hovering area: {card.hovering_area}")
-                
-                # Store current position before calling stop_dragging
-                current_position = card.position
-                
-                # Get old card area before placement attempt
-                old_area = card.current_area
-                
-                # Try to place card on stage - pass (0, 0) as camera offset since events are already adjusted
-                if self.__check_card_placement(card, current_position):
-                    # Stop dragging without resetting position (card will be in placed area)
-                    card.stop_dragging(reset_position=False)
-                    print(f"[Card Placement] Card placed successfully in area: {card.current_area}")
-                else:
-                    # Stop dragging and reset position (card will go back to original)
-                    card.stop_dragging(reset_position=True)
-                    
-                    # ส่งการ์ดกลับไปยัง deck เมื่อวางในพื้นที่ที่ไม่ถูกต้อง
-                    card.current_area = "deck"
-                    print(f"[Card Placement] Card returned to deck due to invalid placement")
-                    
-                    # ถ้าการ์ดเคยอยู่ในพื้นที่เล่นการ์ดก่อนหน้านี้ ให้ลบออกจาก placed_cards
-                    if old_area in ["Navigation", "Collision avoidance", "Recovery"]:
-                        if self.__placed_cards.get(old_area) == card:
-                            self.__placed_cards.pop(old_area, None)
-                            print(f"[Card Placement] Removed card from {old_area} slot")
+        _log("Mouse up: checking for card placement...", level=3)
+        card = self.__dragging_card
+        if card is not None:
+            _log(f"Attempting to place card: {card.card_type} - {card.card_name}", level=3)
+            _log(f"Current position: {card.position}", level=3)
+            _log(f"Current area: {card.current_area}", level=3)
+            _log(f"Hovering area: {card.hovering_area}", level=3)
+            
+            # Store current position before calling stop_dragging
+            current_position = card.position
+            
+            # Get old card area before placement attempt
+            old_area = card.current_area
+            
+            # Try to place card on stage - pass (0, 0) as camera offset since events are already adjusted
+            if self.__check_card_placement(card, current_position):
+                # Stop dragging without resetting position (card will be in placed area)
+                card.stop_dragging(reset_position=False)
+                _log(f"Card placed successfully in area: {card.current_area}")
+            else:
+                # Stop dragging and reset position (card will go back to original)
+                card.stop_dragging(reset_position=True)
                 
-                # Return hovering
-                card.hovering_area = None
-                card.hovering_over_card = False
+                # ส่งการ์ดกลับไปยัง deck เมื่อวางในพื้นที่ที่ไม่ถูกต้อง
+                card.current_area = "deck"
+                _log("Card returned to deck due to invalid placement")
                 
-                # Exit loop after handling the first card that was being dragged
-                break
+                # ถ้าการ์ดเคยอยู่ในพื้นที่เล่นการ์ดก่อนหน้านี้ ให้ลบออกจาก placed_cards
+                if old_area in ["Navigation", "Collision avoidance", "Recovery"]:
+                    if self.__placed_cards.get(old_area) == card:
+                        self.__placed_cards.pop(old_area, None)
+                        _log(f"Removed card from {old_area} slot")
+            
+            # Return hovering
+            card.hovering_area = None
+            card.hovering_over_card = False
+            self.__dragging_card = None
     
     def __handle_mouse_motion(self, pos):
         """Handle mouse motion event.
@@ -386,12 +399,12 @@ class CardDeck:
             if hover_index >= 0 and hover_index < len(deck_cards):
                 deck_cards[hover_index].hover_scale = Config.PREVIEW_HOVER_SCALE
         else:
-            # Update dragging cards
-            for card in self.__cards:
-                if card.dragging:
-                    card.update_dragging(pos)
-                    # Send card to stage for checking
-                    self.stage.handle_card_drag(card, pos, (0, 0))
+            # Update dragging card
+            dragging_card = self.__dragging_card
+            if dragging_card is not None:
+                dragging_card.update_dragging(pos)
+                # Send card to stage for checking
+                self.stage.handle_card_drag(dragging_card, pos, (0, 0))
             
             # Update hover state for all cards
             for card in self.__cards:
@@ -409,7 +422,7 @@ class CardDeck:
         Returns:
             bool: True if card placement is successful, False if it cannot be placed
         """
-        print(f"[CardDeck] Checking placement for card: {card.card_name}")
+        _log(f"Checking placement for card: {card.card_name}", level=3)
         
         # If card is being placed in an area
         if card.hovering_area:
@@ -418,7 +431,7 @@ class CardDeck:
             # Check if there is already a card in this position
             old_card = self.__placed_cards.get(area)
             if old_card and old_card != card:
-                print(f"[CardDeck] Replacing old card: {old_card.card_name} with new card: {card.card_name}")
+                _log(f"Replacing old card: {old_card.card_name} with new card: {card.card_name}")
                 # Change card's area to deck
                 old_card.current_area = "deck"
                 # Return old position to old card
@@ -427,12 +440,12 @@ class CardDeck:
             
             # Place new card
             if self.stage.place_card(card, current_position, (0, 0)):
-                print(f"[CardDeck] Successfully placed card: {card.card_name} in area: {area}")
+                _log(f"Successfully placed card: {card.card_name} in area: {area}", level=3)
                 # Update placed_cards dictionary
                 self.__placed_cards[area] = card
                 return True
         
-        print("[CardDeck] Failed to place card")
+        _log("Failed to place card", level=3)
         return False
     
     def update(self):
@@ -441,13 +454,13 @@ class CardDeck:
         for card in self.__cards:
             card.update()
             
-        # Update dragging card positions
-        mouse_pos = pygame.mouse.get_pos()
-        for card in self.__cards:
-            if card.dragging:
-                card.update_dragging(mouse_pos)
-                # Send card to stage for checking
-                self.stage.handle_card_drag(card, mouse_pos, (0, 0))
+        # Update dragging card position
+        dragging_card = self.__dragging_card
+        if dragging_card is not None:
+            mouse_pos = pygame.mouse.get_pos()
+            dragging_card.update_dragging(mouse_pos)
+            # Send card to stage for checking
+            self.stage.handle_card_drag(dragging_card, mouse_pos, (0, 0))
     
     def draw(self, screen, camera_offset=(0, 0)):
         """Draw all cards in the deck.
@@ -837,6 +850,29 @@ class CardDeck:
         """Get all cards in the deck."""
         return self.__cards
 
+    def is_animating(self):
+        """Check whether any card is moving on its own.
+        
+        Returns:
+            bool: True if a card is being dragged, bobbing under the cursor in
+                preview mode, or still animating out of preview
+        """
+        if self.__dragging_card is not None:
+            return True
+        # The hovered preview card bobs with time (see __calculate_preview_position)
+        if self.__preview_mode and any(card.hover_scale > 1.0 for card in self.__cards):
+            return True
+        return any(card.from_preview and card.animation_progress < 1.0 for card in self.__cards)
+
+    @property
+    def dragging_card(self):
+        """Get the card currently being dragged.
+        
+        Returns:
+            Card: Dragged card, or None if no card is being dragged
+        """
+        return self.__dragging_card
+
     @property
     def game_stage(self):
         """Get the game stage state.
@@ -3,9 +3,36 @@ Configuration module for card game.
 Contains all constants and settings for the game.
 """
 import os
-import glob
+import functools
+from types import MappingProxyType
+from typing import NamedTuple
 import pygame
 
+# Resolved once at import instead of on every image lookup
+_ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+
+class PreviewSettings(NamedTuple):
+    """Settings for the card preview (fan) mode."""
+    radius: int
+    center: tuple
+    hover_lift: int
+    animation_speed: float
+
+
+class ShadowSettings(NamedTuple):
+    """Settings for the card drop shadow."""
+    offset: int
+    opacity: int
+
+
+class CardLayout(NamedTuple):
+    """Card dimensions derived from the window width."""
+    card_width: int
+    card_height: int
+    border_radius: int
+
+
 class Config:
     """Class to store all configuration settings for the card game."""
     
@@ -68,6 +95,14 @@ class Config:
     # Card hover settings
     HOVER_SCALE = 1.1
     
+    # Card types and names (immutable, shared by every caller)
+    _CARD_TYPES = ("Navigation", "Collision avoidance", "Recovery")
+    _CARD_NAMES = MappingProxyType({
+        "Navigation": ("DFS", "BFS", "Dijkstra", "AStar", "RRT"),
+        "Collision avoidance": ("VFH", "BUG"),
+        "Recovery": ("SpinInPlace", "StepBack")
+    })
+    
     @staticmethod
     def get_window_dimensions():
         """Calculate window dimensions based on actual screen size."""
@@ -77,11 +112,29 @@ class Config:
         return window_width, window_height
     
     @staticmethod
-    def get_card_dimensions(window_width):
-        """Calculate card dimensions based on window width."""
+    @functools.lru_cache(maxsize=4)
+    def compute_layout(window_width):
+        """Calculate all card dimensions for a window width in one pass.
+        
+        Args:
+            window_width (int): Width of the game window
+            
+        Returns:
+            CardLayout: Card size and border radius
+        """
         card_width = int(window_width * Config.CARD_WIDTH_RATIO)
         card_height = int(card_width * Config.CARD_HEIGHT_RATIO)
-        return card_width, card_height
+        return CardLayout(
+            card_width=card_width,
+            card_height=card_height,
+            border_radius=int(card_width * Config.CARD_BORDER_RADIUS_RATIO)
+        )
+    
+    @staticmethod
+    def get_card_dimensions(window_width):
+        """Calculate card dimensions based on window width."""
+        layout = Config.compute_layout(window_width)
+        return layout.card_width, layout.card_height
     
     @staticmethod
     def get_card_border_radius(card_width):
@@ -92,12 +145,12 @@ class Config:
     def get_area_positions(window_width, window_height):
         """Get positions for all card placement areas."""
         # Divide the area into 3 symmetrical sections with equal spacing
-        # Use the ratio 1/6, 3/6, 5/6 of the screen width
+        # Use the ratio 1/6, 3/6, 5/6 of the screen width (integer math only)
         return {
-            "Navigation": (int(window_width * (1/6)), window_height // 2),  # Left
-            "Collision avoidance": (int(window_width * (3/6)), window_height // 2),  # Center
-            "Recovery": (int(window_width * (5/6)), window_height // 2),  # Right
-            "deck": (int(window_width * 0.5), int(window_height * 0.85))  # Bottom
+            "Navigation": (window_width // 6, window_height // 2),  # Left
+            "Collision avoidance": (window_width // 2, window_height // 2),  # Center
+            "Recovery": (5 * window_width // 6, window_height // 2),  # Right
+            "deck": (window_width // 2, 17 * window_height // 20)  # Bottom (85%)
         }
     
     @staticmethod
@@ -117,49 +170,48 @@ class Config:
         return valid_width, valid_height
     
     @staticmethod
+    @functools.lru_cache(maxsize=4)
     def get_preview_settings(window_width, window_height):
-        """Get settings for the preview mode."""
-        return {
-            'radius': int(window_height * 0.4),  # 40% of screen height
-            'center': (window_width // 2, int(window_height * 0.6)),  # Center horizontally, 60% of height vertically
-            'hover_lift': 40,  # Amount to lift when hovering
-            'animation_speed': 0.2  # Animation speed (0-1)
-        }
+        """Get settings for the preview mode.
+        
+        The result is cached per window size, so every card shares the same instance.
+        """
+        return PreviewSettings(
+            radius=int(window_height * 0.4),  # 40% of screen height
+            center=(window_width // 2, int(window_height * 0.6)),  # Center horizontally, 60% of height vertically
+            hover_lift=40,  # Amount to lift when hovering
+            animation_speed=0.2  # Animation speed (0-1)
+        )
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_shadow_settings():
         """Get shadow settings for cards."""
-        return {
-            'offset': Config.SHADOW_OFFSET,
-            'opacity': Config.SHADOW_OPACITY
-        }
+        return ShadowSettings(
+            offset=Config.SHADOW_OFFSET,
+            opacity=Config.SHADOW_OPACITY
+        )
     
     @staticmethod
     def get_card_types():
-        """Get valid card types."""
-        return ["Navigation", "Collision avoidance", "Recovery"]
+        """Get valid card types as a read-only tuple."""
+        return Config._CARD_TYPES
     
     @staticmethod
     def get_card_names():
-        """Get valid card names for each type."""
-        return {
-            "Navigation": ["DFS", "BFS", "Dijkstra", "AStar", "RRT"],
-            "Collision avoidance": ["VFH", "BUG"],
-            "Recovery": ["SpinInPlace", "StepBack"]
-        }
+        """Get valid card names for each type as a read-only mapping of tuples."""
+        return Config._CARD_NAMES
     
     @staticmethod
     def load_card_image(card_name):
         """Load card image from assets folder."""
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        image_path = os.path.join(current_dir, "assets", f"{card_name}.png")
-        image_files = glob.glob(image_path)
+        image_path = os.path.join(_ASSETS_DIR, f"{card_name}.png")
         
-        if not image_files:
+        if not os.path.isfile(image_path):
             # Create a placeholder if image is not found
             return None
         
-        return image_files[0]
+        return image_path
     
     @staticmethod
     def get_debug_settings():
@@ -174,7 +226,7 @@ class Config:
         }
     
     @staticmethod
-    def log(module, message, level=2, show_pos=False, mouse_pos=None):
+    def log(module, message, level=2):
         """
         Central logging function that respects log level settings.
         
@@ -182,21 +234,32 @@ class Config:
             module (str): Module name (e.g., "GameManager", "Stage")
             message (str): Message to log
             level (int): Log level (1=Critical, 2=Normal, 3=Verbose)
-            show_pos (bool): Whether to include mouse position
-            mouse_pos (tuple): Current mouse position (x, y)
         """
         # Skip if log level is too low
         if Config.LOG_LEVEL < level:
             return
             
-        # Format basic message
-        log_msg = f"[{module}] {message}"
+        # Print the message
+        print(f"[{module}] {message}")
+    
+    @staticmethod
+    def logger_for(module):
+        """
+        Create a logging function bound to a module name.
         
-        # Add mouse position if requested and available
-        if show_pos and Config.LOG_MOUSE_POSITION and mouse_pos:
-            log_msg += f" | Mouse: {mouse_pos}"
+        The "[module] " prefix is formatted once here instead of on every call.
+        
+        Args:
+            module (str): Module name (e.g., "GameManager", "Stage")
             
-        # Print the message
-        print(log_msg)
+        Returns:
+            callable: Function taking (message, level=2)
+        """
+        prefix = f"[{module}] "
+        
+        def _log(message, level=2):
+            if Config.LOG_LEVEL < level:
+                return
+            print(prefix + message)
         
-    
\ No newline at end of file
+        return _log
@@ -1,11 +1,19 @@
 """
 Costmap module for creating and managing occupancy grid maps.
 """
+import functools
 import pygame
 import numpy as np
 import os
+import re
 from config import Config
 
+# P5 header: magic, width, height and max value separated by whitespace,
+# with optional comment lines, followed by a single whitespace byte
+_PGM_HEADER = re.compile(
+    rb'P5\s+(?:#[^\n]*\n\s*)*(\d+)\s+(?:#[^\n]*\n\s*)*(\d+)\s+(?:#[^\n]*\n\s*)*(\d+)\s'
+)
+
 class Costmap:
     """Class to manage occupancy grid maps for navigation visualization."""
     
@@ -30,9 +38,19 @@ class Costmap:
         # Adjust the resolution slightly to fit exactly
         self.actual_resolution_x = rect_width / self.grid_width
         self.actual_resolution_y = rect_height / self.grid_height
+        self._recalc_pixel_tables()
         
         # Initialize empty grid (0 = free, 1 = occupied)
         self.grid = np.zeros((self.grid_height, self.grid_width), dtype=np.uint8)
+        # Flat view sharing the grid's memory, indexed as grid_flat[row * row_stride + col].
+        # Every writer updates self.grid in place so this view never goes stale.
+        self.grid_flat = self.grid.reshape(-1)
+        self.row_stride = self.grid_width
+        # Zero-copy buffer over the same memory for C/ctypes consumers
+        self.grid_buf = memoryview(self.grid)
+        # Bit-packed copy of the grid (8 cells per byte along each row) for fast
+        # obstacle queries, kept in sync by every writer
+        self.grid_bits = np.packbits(self.grid, axis=1)
         
         # Colors for visualization
         self.free_color = (240, 240, 240)  # Light gray for free space
@@ -40,12 +58,29 @@ class Costmap:
         self.robot_color = (0, 0, 255)      # Blue for robot position
         self.path_color = (0, 255, 0)       # Green for path
         self.goal_color = (255, 0, 0)       # Red for goal
+        self.grid_line_color = (200, 200, 200)  # Light gray for cell borders
+        
+        # Pre-rendered grid surface, rebuilt only when the grid changes
+        self._grid_surface = None
+        self._grid_dirty = True
+        
+        # Grid plus overlays, reused until _version, robot or goal changes
+        self._version = 0
+        self._composed_surface = None
+        self._composed_key = None
+        
+        # Half-cell tiles reused for every path/robot/goal overlay
+        tile_size = (int(self.actual_resolution_x // 2), int(self.actual_resolution_y // 2))
+        self._path_tile = self._create_tile(tile_size, self.path_color)
+        self._robot_tile = self._create_tile(tile_size, self.robot_color)
+        self._goal_tile = self._create_tile(tile_size, self.goal_color)
+        self._tiles_converted = False
         
         # Robot position in grid coordinates
         self.robot_pos = None
         self.goal_pos = None
         self.start_pos = None  # เพิ่ม attribute สำหรับเก็บตำแหน่งเริ่มต้นของหุ่นยนต์
-        self.path = []
+        self.set_path([])
         
         # Load map if path is provided
         if pgm_path and os.path.exists(pgm_path):
@@ -53,6 +88,30 @@ class Costmap:
         else:
             self.reset_demo_map()
         
+    def _recalc_pixel_tables(self):
+        """Precompute per-column and per-row pixel offsets.
+        
+        Must be called again whenever the actual resolution changes.
+        """
+        res_x = self.actual_resolution_x
+        res_y = self.actual_resolution_y
+        
+        # Inverse resolution for pixel -> cell conversion
+        self._inv_rx = 1.0 / res_x
+        self._inv_ry = 1.0 / res_y
+        
+        # Cell borders (one extra entry for the closing border)
+        self._col_px = [int(col * res_x) for col in range(self.grid_width + 1)]
+        self._row_py = [int(row * res_y) for row in range(self.grid_height + 1)]
+        
+        # Top-left corner of the half-cell overlay, inset by a quarter cell
+        self._overlay_px = [int(res_x // 4 + col * res_x) for col in range(self.grid_width)]
+        self._overlay_py = [int(res_y // 4 + row * res_y) for row in range(self.grid_height)]
+        
+        # Cell centers
+        self._center_px = [col * res_x + res_x // 2 for col in range(self.grid_width)]
+        self._center_py = [row * res_y + res_y // 2 for row in range(self.grid_height)]
+    
     def set_cell(self, row, col, value):
         """Set a cell in the grid to a specific value.
         
@@ -63,6 +122,172 @@ class Costmap:
         """
         if 0 <= row < self.grid_height and 0 <= col < self.grid_width:
             self.grid[row, col] = value
+            bit = 0x80 >> (col & 7)
+            if value:
+                self.grid_bits[row, col >> 3] |= bit
+            else:
+                self.grid_bits[row, col >> 3] &= ~bit & 0xFF
+            self._grid_dirty = True
+            self._version += 1
+    
+    def _grid_changed(self):
+        """Refresh derived grid data after a bulk write to self.grid."""
+        self.grid_bits = np.packbits(self.grid, axis=1)
+        self._grid_dirty = True
+        self._version += 1
+    
+    def row_has_obstacle(self, row):
+        """Check whether any cell in a row is occupied.
+        
+        Args:
+            row (int): Row index
+            
+        Returns:
+            bool: True if the row contains an obstacle
+        """
+        return bool(self.grid_bits[row].any())
+    
+    def region_has_obstacle(self, start_row, end_row, start_col, end_col):
+        """Check whether any cell in a rectangular region is occupied.
+        
+        Args:
+            start_row (int): First row (inclusive)
+            end_row (int): Last row (exclusive)
+            start_col (int): First column (inclusive)
+            end_col (int): Last column (exclusive)
+            
+        Returns:
+            bool: True if the region contains an obstacle
+        """
+        col_mask = np.zeros(self.grid_width, dtype=np.uint8)
+        col_mask[start_col:end_col] = 1
+        return bool((self.grid_bits[start_row:end_row] & np.packbits(col_mask)).any())
+    
+    def line_of_sight(self, start, goal):
+        """Check whether the straight line between two cells is obstacle-free.
+        
+        Walks the cells along the line with integer Bresenham steps and stops
+        at the first occupied cell.
+        
+        Args:
+            start (tuple): (row, col) of the first cell
+            goal (tuple): (row, col) of the last cell
+            
+        Returns:
+            bool: True if no cell on the line (endpoints included) is occupied
+        """
+        row, col = start
+        end_row, end_col = goal
+        if not (0 <= row < self.grid_height and 0 <= col < self.grid_width and
+                0 <= end_row < self.grid_height and 0 <= end_col < self.grid_width):
+            return False
+        
+        grid_flat = self.grid_flat
+        stride = self.row_stride
+        d_row = abs(end_row - row)
+        d_col = abs(end_col - col)
+        step_row = 1 if end_row > row else -1
+        step_col = 1 if end_col > col else -1
+        error = d_col - d_row
+        
+        while True:
+            if grid_flat[row * stride + col]:
+                return False
+            if row == end_row and col == end_col:
+                return True
+            doubled = 2 * error
+            if doubled > -d_row:
+                error -= d_row
+                col += step_col
+            if doubled < d_col:
+                error += d_col
+                row += step_row
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def make_circle_template(radius):
+        """Get the (row, col) offsets covered by a circular footprint.
+        
+        Templates are cached per radius and returned read-only. A negative
+        radius covers no cells, as in add_circular_obstacle.
+        
+        Args:
+            radius (int): Footprint radius in cells
+            
+        Returns:
+            np.ndarray: (N, 2) int32 array of (d_row, d_col) offsets
+        """
+        if radius < 0:
+            template = np.empty((0, 2), dtype=np.int32)
+            template.flags.writeable = False
+            return template
+        
+        d_row, d_col = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+        inside = d_row**2 + d_col**2 <= radius**2
+        template = np.column_stack((d_row[inside], d_col[inside])).astype(np.int32)
+        template.flags.writeable = False
+        return template
+    
+    def footprint_collides(self, row, col, radius):
+        """Check whether a circular footprint centered on a cell hits an obstacle.
+        
+        Cells of the footprint outside the grid count as collisions. A negative
+        radius is an empty footprint and never collides.
+        
+        Args:
+            row (int): Center row
+            col (int): Center column
+            radius (int): Footprint radius in cells
+            
+        Returns:
+            bool: True if the footprint overlaps an obstacle or the grid edge
+        """
+        template = self.make_circle_template(radius)
+        if not len(template):
+            return False
+        rows = template[:, 0] + row
+        cols = template[:, 1] + col
+        if (rows.min() < 0 or rows.max() >= self.grid_height or
+                cols.min() < 0 or cols.max() >= self.grid_width):
+            return True
+        return bool(self.grid[rows, cols].any())
+    
+    def _flat_index(self, row, col):
+        """Return the index of a cell in grid_flat.
+        
+        Args:
+            row (int): Row index
+            col (int): Column index
+            
+        Returns:
+            int: Flat index of the cell
+        """
+        return row * self.row_stride + col
+    
+    @property
+    def render_key(self):
+        """Get a key that changes whenever the drawn map would change.
+        
+        robot_pos/goal_pos are also assigned directly by callers, so they are
+        part of the key instead of bumping the version.
+        
+        Returns:
+            tuple: (version, robot_pos, goal_pos)
+        """
+        return (self._version, self.robot_pos, self.goal_pos)
+    
+    @property
+    def grid_ptr(self):
+        """Get the address of the grid's first cell.
+        
+        The grid is a C-contiguous (row-major) uint8 array of shape
+        (grid_height, grid_width) with a row stride of grid_width bytes. It is
+        never reallocated, so the address stays valid for the costmap's lifetime.
+        
+        Returns:
+            int: Memory address usable with ctypes/cffi
+        """
+        return self.grid.ctypes.data
     
     def get_cell(self, row, col):
         """Get the value of a cell in the grid.
@@ -137,14 +362,18 @@ class Costmap:
         Args:
             path (list): List of (row, col) tuples representing the path
         """
-        # Validate path to prevent crashes
-        valid_path = []
-        for pos in path:
-            if len(pos) == 2:  # Check if pos is a valid tuple with 2 elements
-                row, col = pos
-                if 0 <= row < self.grid_height and 0 <= col < self.grid_width:
-                    valid_path.append(pos)
-        self.path = valid_path
+        # Validate path to prevent crashes: keep (row, col) pairs inside the grid
+        path_arr = np.asarray([pos for pos in path if len(pos) == 2], dtype=np.intp).reshape(-1, 2)
+        in_bounds = ((path_arr[:, 0] >= 0) & (path_arr[:, 0] < self.grid_height) &
+                     (path_arr[:, 1] >= 0) & (path_arr[:, 1] < self.grid_width))
+        path_arr = path_arr[in_bounds]
+        
+        self.path = [tuple(pos) for pos in path_arr.tolist()]
+        self._path_arr = path_arr
+        self._version += 1
+        # Overlay pixel offsets of every path cell, reused by draw()
+        self._path_px = np.column_stack((np.asarray(self._overlay_px)[path_arr[:, 1]],
+                                         np.asarray(self._overlay_py)[path_arr[:, 0]]))
     
     def add_rectangle_obstacle(self, start_row, start_col, width, height):
         """Add a rectangular obstacle to the grid.
@@ -160,9 +389,10 @@ class Costmap:
             start_row >= self.grid_height or start_col >= self.grid_width):
             return  # Skip if starting point is out of bounds
         
-        for row in range(start_row, min(start_row + height, self.grid_height)):
-            for col in range(start_col, min(start_col + width, self.grid_width)):
-                self.set_cell(row, col, 1)
+        end_row = min(start_row + height, self.grid_height)
+        end_col = min(start_col + width, self.grid_width)
+        self.grid[start_row:end_row, start_col:end_col] = 1
+        self._grid_changed()
     
     def add_circular_obstacle(self, center_row, center_col, radius):
         """Add a circular obstacle to the grid.
@@ -183,95 +413,176 @@ class Costmap:
         col_start = max(0, center_col - radius)
         col_end = min(self.grid_width, center_col + radius + 1)
         
-        for row in range(row_start, row_end):
-            for col in range(col_start, col_end):
-                if (row - center_row)**2 + (col - center_col)**2 <= radius**2:
-                    self.set_cell(row, col, 1)
+        # Mark every cell of the bounding box that falls inside the circle
+        rows, cols = np.ogrid[row_start:row_end, col_start:col_end]
+        mask = (rows - center_row)**2 + (cols - center_col)**2 <= radius**2
+        self.grid[row_start:row_end, col_start:col_end][mask] = 1
+        self._grid_changed()
+    
+    def add_obstacles_batch(self, rects=(), circles=()):
+        """Add many rectangular and circular obstacles in one pass.
+        
+        Obstacles whose starting/center cell is outside the grid are skipped,
+        as with add_rectangle_obstacle and add_circular_obstacle.
+        
+        Args:
+            rects (array-like): Rows of (start_row, start_col, width, height)
+            circles (array-like): Rows of (center_row, center_col, radius)
+        """
+        rects = np.asarray(rects, dtype=np.intp).reshape(-1, 4)
+        circles = np.asarray(circles, dtype=np.intp).reshape(-1, 3)
+        
+        # Cell coordinates broadcast against one obstacle per leading axis entry
+        rows = np.arange(self.grid_height)[None, :, None]
+        cols = np.arange(self.grid_width)[None, None, :]
+        occupied = np.zeros(self.grid.shape, dtype=bool)
+        
+        rects = rects[(rects[:, 0] >= 0) & (rects[:, 0] < self.grid_height) &
+                      (rects[:, 1] >= 0) & (rects[:, 1] < self.grid_width)]
+        if len(rects):
+            start_row, start_col, width, height = (rects[:, i, None, None] for i in range(4))
+            occupied |= ((rows >= start_row) & (rows < start_row + height) &
+                         (cols >= start_col) & (cols < start_col + width)).any(axis=0)
+        
+        # A negative radius draws nothing in add_circular_obstacle, so drop it here too
+        circles = circles[(circles[:, 0] >= 0) & (circles[:, 0] < self.grid_height) &
+                          (circles[:, 1] >= 0) & (circles[:, 1] < self.grid_width) &
+                          (circles[:, 2] >= 0)]
+        if len(circles):
+            center_row, center_col, radius = (circles[:, i, None, None] for i in range(3))
+            occupied |= ((rows - center_row)**2 + (cols - center_col)**2 <= radius**2).any(axis=0)
+        
+        self.grid[occupied] = 1
+        self._grid_changed()
     
     def clear_grid(self):
         """Clear the grid (set all cells to free)."""
         self.grid.fill(0)
+        self.grid_bits.fill(0)
+        self._grid_dirty = True
+        self._version += 1
+    
+    @staticmethod
+    def _create_tile(size, color):
+        """Create a solid-color tile surface used for overlays.
+        
+        Args:
+            size (tuple): (width, height) of the tile in pixels
+            color (tuple): Fill color
+            
+        Returns:
+            pygame.Surface: Filled tile surface
+        """
+        tile = pygame.Surface(size)
+        tile.fill(color)
+        return tile
+    
+    def _render_grid_surface(self):
+        """Render the occupancy grid and cell borders into a new surface.
+        
+        Returns:
+            pygame.Surface: Surface of size (rect_width, rect_height)
+        """
+        width = int(self.rect_width)
+        height = int(self.rect_height)
+        
+        grid_surface = pygame.Surface((width, height))
+        grid_surface.fill(self.free_color)
         
+        # Fill occupied cells as horizontal runs: one fill per run of
+        # consecutive obstacles in a row instead of one per cell
+        occupied = np.pad(self.grid != 0, ((0, 0), (1, 1))).astype(np.int8)
+        edges = np.diff(occupied, axis=1)
+        run_starts = np.argwhere(edges == 1).tolist()
+        run_ends = np.argwhere(edges == -1)[:, 1]
+        col_px = self._col_px
+        row_py = self._row_py
+        for (row, start_col), end_col in zip(run_starts, run_ends.tolist()):
+            grid_surface.fill(self.occupied_color,
+                              (col_px[start_col], row_py[row],
+                               col_px[end_col] - col_px[start_col], row_py[row + 1] - row_py[row]))
+        
+        # Cell borders as one-pixel-wide fills
+        for x in col_px:
+            grid_surface.fill(self.grid_line_color, (min(x, width - 1), 0, 1, height))
+        for y in row_py:
+            grid_surface.fill(self.grid_line_color, (0, min(y, height - 1), width, 1))
+        
+        return grid_surface
+        
+    def _compose_surface(self):
+        """Render the grid with path, robot and goal overlays into a new surface.
+        
+        Returns:
+            pygame.Surface: Surface of size (rect_width, rect_height)
+        """
+        # Rebuild the cached grid surface only when the grid has changed
+        if self._grid_dirty or self._grid_surface is None:
+            self._grid_surface = self._render_grid_surface()
+            if self._tiles_converted:
+                self._grid_surface = self._grid_surface.convert()
+            self._grid_dirty = False
+        
+        composed = self._grid_surface.copy()
+        
+        # Overlays are inset by a quarter cell and are half a cell in size
+        overlay_px = self._overlay_px
+        overlay_py = self._overlay_py
+        
+        # Draw path if it exists (don't draw over robot/goal)
+        blit_sequence = []
+        path_arr = self._path_arr
+        if len(path_arr):
+            keep = np.ones(len(path_arr), dtype=bool)
+            for pos in (self.robot_pos, self.goal_pos):
+                if pos:
+                    keep &= (path_arr[:, 0] != pos[0]) | (path_arr[:, 1] != pos[1])
+            path_tile = self._path_tile
+            blit_sequence = [(path_tile, position) for position in self._path_px[keep].tolist()]
+        
+        # Draw robot and goal markers; positions can be assigned directly or outlive
+        # a map change, so skip any that fall outside the grid (negative indices would wrap)
+        grid_height = self.grid_height
+        grid_width = self.grid_width
+        for pos, tile in ((self.robot_pos, self._robot_tile), (self.goal_pos, self._goal_tile)):
+            if pos:
+                row, col = pos
+                if 0 <= row < grid_height and 0 <= col < grid_width:
+                    blit_sequence.append((tile, (overlay_px[col], overlay_py[row])))
+        
+        composed.blits(blit_sequence, doreturn=False)
+        return composed
+    
     def draw(self, surface, rect_start):
         """Draw the costmap on a surface.
         
+        The composed map is cached and only re-rendered when the grid, path,
+        robot or goal has changed since the last draw.
+        
         Args:
             surface (pygame.Surface): Surface to draw on
             rect_start (tuple): (x, y) coordinates of the top-left corner
         """
-        try:
-            x_offset, y_offset = rect_start
-            rect_width = self.rect_width
-            rect_height = self.rect_height
-            
-            # Draw grid cells - using the exact calculated resolution
-            for row in range(self.grid_height):
-                for col in range(self.grid_width):
-                    # Calculate cell position and size using the actual resolution
-                    cell_rect = (
-                        x_offset + col * self.actual_resolution_x,
-                        y_offset + row * self.actual_resolution_y,
-                        self.actual_resolution_x,
-                        self.actual_resolution_y
-                    )
-                    
-                    # Draw cell with appropriate color
-                    if row < len(self.grid) and col < len(self.grid[row]):
-                        if self.grid[row][col] == 0:
-                            pygame.draw.rect(surface, self.free_color, cell_rect)
-                        else:
-                            pygame.draw.rect(surface, self.occupied_color, cell_rect)
-                    else:
-                        # Fallback for any out-of-bounds issues
-                        pygame.draw.rect(surface, self.free_color, cell_rect)
-                    
-                    # Draw cell border (thinner for better appearance)
-                    pygame.draw.rect(surface, (200, 200, 200), cell_rect, 1)
-            
-            # Draw path if it exists
-            for pos in self.path:
-                if pos != self.robot_pos and pos != self.goal_pos:  # Don't draw over robot/goal
-                    if len(pos) == 2:  # Safety check
-                        row, col = pos
-                        if 0 <= row < self.grid_height and 0 <= col < self.grid_width:
-                            # ตรวจสอบว่าเซลล์อยู่ในขอบเขตของแผนที่หรือไม่
-                            path_rect = (
-                                x_offset + col * self.actual_resolution_x + self.actual_resolution_x // 4,
-                                y_offset + row * self.actual_resolution_y + self.actual_resolution_y // 4,
-                                self.actual_resolution_x // 2,
-                                self.actual_resolution_y // 2
-                            )
-                            pygame.draw.rect(surface, self.path_color, path_rect)
-            
-            # Draw robot position if it exists
-            if self.robot_pos and len(self.robot_pos) == 2:
-                row, col = self.robot_pos
-                if 0 <= row < self.grid_height and 0 <= col < self.grid_width:
-                    # ตรวจสอบว่าหุ่นยนต์อยู่ในขอบเขตของแผนที่หรือไม่
-                    robot_rect = (
-                        x_offset + col * self.actual_resolution_x + self.actual_resolution_x // 4,
-                        y_offset + row * self.actual_resolution_y + self.actual_resolution_y // 4,
-                        self.actual_resolution_x // 2,
-                        self.actual_resolution_y // 2
-                    )
-                    pygame.draw.rect(surface, self.robot_color, robot_rect)
-            
-            # Draw goal position if it exists
-            if self.goal_pos and len(self.goal_pos) == 2:
-                row, col = self.goal_pos
-                if 0 <= row < self.grid_height and 0 <= col < self.grid_width:
-                    # ตรวจสอบว่าเป้าหมายอยู่ในขอบเขตของแผนที่หรือไม่
-                    goal_rect = (
-                        x_offset + col * self.actual_resolution_x + self.actual_resolution_x // 4,
-                        y_offset + row * self.actual_resolution_y + self.actual_resolution_y // 4,
-                        self.actual_resolution_x // 2,
-                        self.actual_resolution_y // 2
-                    )
-                    pygame.draw.rect(surface, self.goal_color, goal_rect)
+        # Nothing to do when the map lies entirely outside the drawable area
+        if not surface.get_clip().colliderect(pygame.Rect(rect_start, (self.rect_width, self.rect_height))):
+            return
         
-        except Exception as e:
-            print(f"Error in drawing costmap: {e}")
-            # Continue without crashing if there's an error
+        # Match overlay tiles to the display pixel format once a display exists
+        # so every blit is a plain copy (convert() needs a display mode)
+        if not self._tiles_converted and pygame.display.get_surface() is not None:
+            self._path_tile = self._path_tile.convert()
+            self._robot_tile = self._robot_tile.convert()
+            self._goal_tile = self._goal_tile.convert()
+            self._tiles_converted = True
+            self._grid_dirty = True
+            self._composed_surface = None
+        
+        composed_key = self.render_key
+        if self._composed_surface is None or composed_key != self._composed_key:
+            self._composed_surface = self._compose_surface()
+            self._composed_key = composed_key
+        
+        surface.blit(self._composed_surface, rect_start)
     
     def px_to_grid(self, px, py):
         """Convert pixel coordinates to grid coordinates.
@@ -283,15 +594,19 @@ class Costmap:
         Returns:
             tuple: (row, col) grid coordinates
         """
-        try:
-            # Use the actual resolution for conversion
-            col = max(0, min(self.grid_width - 1, int(px / self.actual_resolution_x)))
-            row = max(0, min(self.grid_height - 1, int(py / self.actual_resolution_y)))
-            return row, col
-        except Exception as e:
-            print(f"Error in px_to_grid conversion: {e}")
-            # Return a safe default value
-            return 0, 0
+        col = int(px * self._inv_rx)
+        row = int(py * self._inv_ry)
+        
+        # Clamp to the grid
+        if col < 0:
+            col = 0
+        elif col >= self.grid_width:
+            col = self.grid_width - 1
+        if row < 0:
+            row = 0
+        elif row >= self.grid_height:
+            row = self.grid_height - 1
+        return row, col
     
     def grid_to_px(self, row, col):
         """Convert grid coordinates to pixel coordinates.
@@ -303,45 +618,36 @@ class Costmap:
         Returns:
             tuple: (px, py) pixel coordinates (center of cell)
         """
-        try:
-            # Validate input
-            row = max(0, min(self.grid_height - 1, row))
-            col = max(0, min(self.grid_width - 1, col))
-            
-            # Use the actual resolution for conversion
-            px = col * self.actual_resolution_x + self.actual_resolution_x // 2
-            py = row * self.actual_resolution_y + self.actual_resolution_y // 2
-            return px, py
-        except Exception as e:
-            print(f"Error in grid_to_px conversion: {e}")
-            # Return a safe default value
-            return 0, 0
+        # Clamp to the grid
+        if col < 0:
+            col = 0
+        elif col >= self.grid_width:
+            col = self.grid_width - 1
+        if row < 0:
+            row = 0
+        elif row >= self.grid_height:
+            row = self.grid_height - 1
+        
+        # Look up the precomputed cell center
+        return self._center_px[col], self._center_py[row]
 
     def reset_demo_map(self):
         """Reset the grid and create a demo map with obstacles."""
-        try:
-            self.clear_grid()
-            
-            # Add walls around the edges
-            for col in range(self.grid_width):
-                self.set_cell(0, col, 1)  # Top wall
-                self.set_cell(self.grid_height - 1, col, 1)  # Bottom wall
-            
-            for row in range(self.grid_height):
-                self.set_cell(row, 0, 1)  # Left wall
-                self.set_cell(row, self.grid_width - 1, 1)  # Right wall
-            
-            # Add some obstacles
-            self.add_rectangle_obstacle(5, 5, 5, 10)
-            self.add_rectangle_obstacle(15, 15, 10, 5)
-            self.add_circular_obstacle(10, 20, 3)
-            
-            # Set robot and goal
-            self.set_robot_position(5, 2)
-            self.set_goal_position(self.grid_height - 5, self.grid_width - 5)
-        except Exception as e:
-            print(f"Error in reset_demo_map: {e}")
-            # Continue without crashing
+        self.clear_grid()
+        
+        # Add walls around the edges
+        self.grid[0, :] = 1  # Top wall
+        self.grid[-1, :] = 1  # Bottom wall
+        self.grid[:, 0] = 1  # Left wall
+        self.grid[:, -1] = 1  # Right wall
+        
+        # Add some obstacles
+        self.add_obstacles_batch(rects=[(5, 5, 5, 10), (15, 15, 10, 5)],
+                                 circles=[(10, 20, 3)])
+        
+        # Set robot and goal
+        self.set_robot_position(5, 2)
+        self.set_goal_position(self.grid_height - 5, self.grid_width - 5)
 
     def load_pgm_map(self, pgm_path):
         """Load a map from a PGM file.
@@ -355,51 +661,42 @@ class Costmap:
         try:
             # Read the PGM file
             with open(pgm_path, 'rb') as f:
-                # Read the header (P5 for grayscale PGM)
-                header = f.readline().decode('utf-8').strip()
-                
-                if header != 'P5':
+                # Parse the header (P5 for grayscale PGM) in one pass,
+                # then seek to the start of the pixel data
+                match = _PGM_HEADER.match(f.read(4096))
+                if match is None:
                     print(f"Error: {pgm_path} is not a valid PGM file (expected P5 header)")
                     return False
                 
-                # Skip comment lines
-                line = f.readline().decode('utf-8').strip()
-                while line.startswith('#'):
-                    line = f.readline().decode('utf-8').strip()
-                
-                # Parse width and height
-                width, height = [int(x) for x in line.split()]
-                
-                # Read max value (for grayscale)
-                max_val = int(f.readline().decode('utf-8').strip())
+                width, height, max_val = (int(x) for x in match.groups())
+                f.seek(match.end())
                 
-                # Read pixel data
-                data = f.read()
-                
-                # Convert data to numpy array
+                # Read pixel data straight into a numpy array
                 if max_val <= 255:
                     # 8-bit grayscale
-                    array = np.frombuffer(data, dtype=np.uint8).reshape(height, width)
+                    dtype = np.uint8
                 else:
-                    # 16-bit grayscale (rare)
-                    array = np.frombuffer(data, dtype=np.uint16).reshape(height, width)
+                    # 16-bit grayscale (rare, big-endian per the PGM spec)
+                    dtype = '>u2'
+                array = np.fromfile(f, dtype=dtype, count=width * height).reshape(height, width)
+                
+                # Resize array to match our grid dimensions if necessary
+                # (nearest-neighbor sampling with precomputed index arrays)
+                if array.shape != (self.grid_height, self.grid_width):
+                    print(f"Warning: Resizing map from {array.shape} to {(self.grid_height, self.grid_width)}")
+                    scale_y = height / self.grid_height
+                    scale_x = width / self.grid_width
+                    row_idx = np.minimum(height - 1, (np.arange(self.grid_height) * scale_y).astype(np.intp))
+                    col_idx = np.minimum(width - 1, (np.arange(self.grid_width) * scale_x).astype(np.intp))
+                    array = array[row_idx[:, None], col_idx[None, :]]
                 
                 # Convert to binary matrix (0 for free space, 1 for obstacles)
                 # Assume that darker values (lower values) are obstacles
+                # (compare straight into the existing grid buffer through a bool
+                # view, avoiding a temporary array and keeping grid_flat valid)
                 threshold = max_val // 2
-                binary_array = (array < threshold).astype(np.uint8)
-                
-                # Resize array to match our grid dimensions if necessary
-                if binary_array.shape != (self.grid_height, self.grid_width):
-                    print(f"Warning: Resizing map from {binary_array.shape} to {(self.grid_height, self.grid_width)}")
-                    from scipy.ndimage import zoom
-                    zoom_factors = (self.grid_height / binary_array.shape[0], 
-                                    self.grid_width / binary_array.shape[1])
-                    binary_array = zoom(binary_array, zoom_factors, order=0)
-                    binary_array = (binary_array > 0.5).astype(np.uint8)  # Re-threshold after zoom
-                
-                # Update the grid
-                self.grid = binary_array
+                np.less(array, threshold, out=self.grid.view(np.bool_))
+                self._grid_changed()
                 
                 # ไม่ตั้งค่าตำแหน่งโดยอัตโนมัติอีกต่อไป เพื่อให้สามารถใช้ค่าจาก levels.csv ได้
                 # ถ้ายังไม่มีการตั้งค่าตำแหน่งหุ่นยนต์และเป้าหมาย จึงค่อยเรียกใช้ 
@@ -419,37 +716,18 @@ class Costmap:
         Automatically set default positions for robot and goal on free spaces.
         Robot is placed at top-left free cell, goal at bottom-right free cell.
         """
-        try:
-            # Find a free space for robot (top-left)
-            robot_placed = False
-            for row in range(self.grid_height):
-                if robot_placed:
-                    break
-                for col in range(self.grid_width):
-                    if self.grid[row, col] == 0:  # Free space
-                        self.robot_pos = (row, col)
-                        self.start_pos = (row, col)  # กำหนดตำแหน่งเริ่มต้นของหุ่นยนต์
-                        robot_placed = True
-                        break
-            
-            # Find a free space for goal (bottom-right)
-            goal_placed = False
-            for row in range(self.grid_height - 1, -1, -1):
-                if goal_placed:
-                    break
-                for col in range(self.grid_width - 1, -1, -1):
-                    if self.grid[row, col] == 0:  # Free space
-                        self.goal_pos = (row, col)
-                        goal_placed = True
-                        break
-                        
-            if robot_placed and goal_placed:
-                print(f"Set default robot position at {self.robot_pos} and goal at {self.goal_pos}")
-            else:
-                print("Warning: Could not set default positions for robot and/or goal")
-                
-        except Exception as e:
-            print(f"Error setting default positions: {e}")
+        # All free cells in row-major order: the first is the top-left
+        # free cell, the last is the bottom-right free cell
+        free = np.argwhere(self.grid == 0)
+        if len(free) == 0:
+            print("Warning: Could not set default positions for robot and/or goal")
+            return
+        
+        self.robot_pos = (int(free[0, 0]), int(free[0, 1]))
+        self.start_pos = self.robot_pos  # กำหนดตำแหน่งเริ่มต้นของหุ่นยนต์
+        self.goal_pos = (int(free[-1, 0]), int(free[-1, 1]))
+        
+        print(f"Set default robot position at {self.robot_pos} and goal at {self.goal_pos}")
 
     def reset(self):
         """
@@ -458,7 +736,7 @@ class Costmap:
         This clears the path and resets robot to its initial position.
         """
         # Clear the path
-        self.path = []
+        self.set_path([])
         
         # ถ้ามีการกำหนดตำแหน่งเริ่มต้นของหุ่นยนต์ไว้ ให้รีเซ็ตกลับไปยังตำแหน่งนั้น
         if self.start_pos:
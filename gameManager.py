@@ -2,6 +2,8 @@
 GameManager module for managing the main game loop and states.
 """
 import pygame
+import csv
+import math
 import os
 import random
 import time
@@ -15,6 +17,60 @@ from login_screen import LoginScreen
 from statistic import Statistics
 from player_data import PlayerData
 
+# Fired once by an SDL timer when the auto-start delay after start_game has elapsed
+AUTO_START_EVENT = pygame.event.custom_type()
+
+# Event types the game (including the login and statistics screens) reacts to.
+# Everything else is blocked at the SDL level so it never reaches Python.
+HANDLED_EVENT_TYPES = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.TEXTINPUT,  # KEYDOWN.unicode is filled from TEXTINPUT (login name entry)
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.WINDOWEXPOSED,  # Forces a redraw when the window is uncovered
+    AUTO_START_EVENT,
+]
+
+# Constants checked for every event, bound once to skip the pygame attribute lookups
+_QUIT = pygame.QUIT
+_KEYDOWN = pygame.KEYDOWN
+_MOUSEMOTION = pygame.MOUSEMOTION
+_MOUSEBUTTONDOWN = pygame.MOUSEBUTTONDOWN
+_K_ESCAPE = pygame.K_ESCAPE
+
+# Game state values, resolved once (Enum .value is a descriptor lookup on every access).
+# change_state stores these same str objects, so the == checks hit the identity fast path.
+_STATE_LOGIN = GameStateEnum.LOGIN.value
+_STATE_CARD_CHOOSING = GameStateEnum.CARD_CHOOSING.value
+_STATE_PLAYING = GameStateEnum.PLAYING.value
+_STATE_FINISH = GameStateEnum.FINISH.value
+_STATE_PAUSE = GameStateEnum.PAUSE.value
+
+# Card descriptions shown in the new-cards notification, by type and name
+_CARD_DESCRIPTIONS = {
+    "Navigation": {
+        "DFS": "Depth-First Search: Explores as far as possible along branches before backtracking.",
+        "BFS": "Breadth-First Search: Explores all neighbors at current depth before moving deeper.",
+        "Dijkstra": "Dijkstra's Algorithm: Finds shortest path using a priority queue based on distance.",
+        "AStar": "A* Search: Uses heuristics to find shortest path more efficiently than Dijkstra.",
+        "RRT": "Rapidly-exploring Random Tree: Efficiently explores large areas by random sampling."
+    },
+    "Collision avoidance": {
+        "VFH": "Vector Field Histogram: Avoids obstacles using local environment representation.",
+        "BUG": "Bug Algorithm: Simple approach that follows obstacles until path is clear."
+    },
+    "Recovery": {
+        "SpinInPlace": "Spin In Place: Rotates in place to find a new valid path.",
+        "StepBack": "Step Back: Moves backward to recover from obstacles."
+    }
+}
+
+# Event-path diagnostics go through the level-filtered logger (quiet at the default LOG_LEVEL)
+_log = Config.logger_for("GameManager")
+
 class GameManager:
     """
     Main game manager class that handles the game loop, states, and interactions.
@@ -46,6 +102,10 @@ class GameManager:
         self.screen = pygame.display.set_mode((self.window_width, self.window_height))
         pygame.display.set_caption("Card Game")
         
+        # Only queue the events we handle
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENT_TYPES)
+        
         # Initialize game state first
         self.game_state = GameState()  # Use singleton pattern
         
@@ -64,6 +124,9 @@ class GameManager:
         self.clock = pygame.time.Clock()
         self.running = True
         
+        # Set when input arrives; frames with no input and no animation are not redrawn
+        self._needs_redraw = True
+        
         # Check for PGM file
         pgm_file_path = os.path.join("data", "map.pgm")
         
@@ -79,20 +142,40 @@ class GameManager:
         # Camera variables
         self.camera_y = 0
         self.target_camera_y = 0
-        self.camera_speed = 0.05  # Speed of camera movement (0-1, 1 = instant)
+        self.camera_offset = (0, 0)  # Whole-pixel (x, y) draw offset, refreshed only while the camera moves
+        self.camera_speed = 3.0  # Camera approach rate per second (~5% of the distance per frame at 60 FPS)
         self.camera_animating = False
         
         # Timer for auto-starting algorithm
-        self.algorithm_start_time = 0
         self.should_auto_start = False
+        self.auto_start_due = False  # Set by AUTO_START_EVENT, consumed in update()
         self.auto_start_delay = 2 
         
+        # Algorithm currently driving the robot (None when idle)
+        self.current_algorithm = None
+        
+        # KEYDOWN dispatch table (ปุ่ม N ใช้เลื่อนไปด่านถัดไป สำหรับการทดสอบ)
+        self.__key_actions = {
+            pygame.K_SPACE: self.__handle_space_key,
+            pygame.K_n: self.advance_to_next_level,
+        }
+        
+        # Event dispatch table for handle_events (MOUSEMOTION is coalesced inline)
+        self.__event_handlers = {
+            _QUIT: self.__on_quit,
+            _KEYDOWN: self.__on_key_down,
+            _MOUSEBUTTONDOWN: self.__on_mouse_button_down,
+        }
+        
         # Variables for displaying newly unlocked cards
         self.new_cards_notification = False
         self.new_cards = []
         self.notification_start_time = 0
         self.notification_duration = 5  # Display for 5 seconds
         
+        # levels.csv is static: parse it once and look levels up by number afterwards
+        self.level_settings = self.__load_level_settings()
+        
         # Load map for current level
         self.load_current_level_map()
         
@@ -104,15 +187,51 @@ class GameManager:
         self.timer_rect = pygame.Rect(0, 0, 350, 50)  # Define area for time display
         self.timer_rect.centerx = self.window_width // 2
         self.timer_rect.top = 20
+        
+        # HUD text caches: fonts by size, static labels by (size, text, color),
+        # and single timer glyphs so the MM:SS.ms readout is never re-rendered whole
+        self.__hud_fonts = {36: self.timer_font}
+        self.__hud_labels = {}
+        self.__timer_glyphs = {}
+        
+        # Colors read by draw() every frame
+        self.background_color = Config.BACKGROUND_COLOR
+        self.text_color = Config.WHITE_COLOR
+        
+        # Map panel area (at camera_y == 0) and the window area it is clipped against
+        self.map_panel_rect = pygame.Rect(147, -368, 907, 455)
+        self.screen_rect = self.screen.get_rect()
+        
+        # Rounded-corner clip mask and white 3px border for the map panel, rendered once
+        self.map_panel_mask = pygame.Surface(self.map_panel_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(self.map_panel_mask, (255, 255, 255, 255), self.map_panel_mask.get_rect(), 0, border_radius=10)
+        self.map_panel_border = pygame.Surface(self.map_panel_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(self.map_panel_border, Config.WHITE_COLOR, self.map_panel_border.get_rect(), 3, border_radius=10)
+        
+        # Translucent HUD backdrops, rendered once and only blitted in draw()
+        self.timer_bg = pygame.Surface((350, 45), pygame.SRCALPHA)  # Increased width from 200 to 350
+        self.timer_bg.fill((0, 0, 0, 128))
+        self.finish_overlay = pygame.Surface((self.window_width, self.window_height), pygame.SRCALPHA)
+        self.finish_overlay.fill((0, 0, 0, 180))  # Transparent black (alpha 180/255)
+        self.pause_overlay = pygame.Surface((self.window_width, self.window_height), pygame.SRCALPHA)
+        self.pause_overlay.fill((0, 0, 0, 150))  # Transparent black
+        self.notification_bg = pygame.Surface((600, 400), pygame.SRCALPHA)  # Increased from 500x300
+        self.notification_bg.fill((0, 0, 0, 180))  # Transparent black
+        
+        # Clipped map panel, rebuilt only when the costmap changes (at most once per algorithm step)
+        self.map_panel_surface = None
+        self.map_panel_key = None
     
     def handle_events(self):
         """Handle all game events."""
         events = pygame.event.get()
+        if events:
+            self._needs_redraw = True
         
         # ถ้าอยู่ในหน้าล็อกอิน ให้จัดการอีเวนต์ของหน้าล็อกอินเท่านั้น
-        if self.game_state.get_state() == GameStateEnum.LOGIN.value:
+        if self.game_state.get_state() == _STATE_LOGIN:
             for event in events:
-                if event.type == pygame.QUIT:
+                if event.type == _QUIT:
                     self.running = False
                     
             # จัดการอีเวนต์ของหน้าล็อกอิน
@@ -122,7 +241,7 @@ class GameManager:
                 username = self.login_screen.get_username()
                 self.game_state.set_username(username)
                 self.statistics.set_username(username)
-                self.game_state.change_state(GameStateEnum.CARD_CHOOSING.value)
+                self.game_state.change_state(_STATE_CARD_CHOOSING)
                 print(f"User logged in as: {username}")
                 
                 # ตรวจสอบว่าเป็นผู้เล่นเก่าที่โหลดข้อมูลมาหรือไม่
@@ -154,177 +273,183 @@ class GameManager:
                 
             return
             
-        # ตรวจสอบการกด ESC เพื่อเข้าสู่โหมด PAUSE
+        # ถ้าไม่ได้อยู่ในหน้าล็อกอิน ให้จัดการอีเวนต์ของเกมตามปกติ (ในรอบเดียว)
+        paused = self.game_state.get_state() == _STATE_PAUSE
+        motion_pos = None
+        event_handlers = self.__event_handlers
         for event in events:
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                # ถ้าอยู่ในโหมด PAUSE ให้กลับไปยังสถานะก่อนหน้า
-                if self.game_state.get_state() == GameStateEnum.PAUSE.value:
-                    # หากกำลังเล่นอยู่ในโหมด PLAYING ก่อนจะ PAUSE
-                    # ให้เริ่มจับเวลาใหม่โดยตั้งค่าเวลาเริ่มต้นใหม่
-                    # การรีเซ็ตนี้ทำให้เวลาเริ่มนับต่อจากจุดที่หยุดไว้
-                    self.statistics.start_timer()
-                    
-                    # เปลี่ยนกลับไปยังสถานะก่อนหน้า (PLAYING หรือ CARD_CHOOSING)
-                    if self.camera_y > 0:
-                        self.game_state.change_state(GameStateEnum.PLAYING.value)
-                    else:
-                        self.game_state.change_state(GameStateEnum.CARD_CHOOSING.value)
-                    return  # ดำเนินการต่อโดยไม่ต้องทำส่วนอื่น
-                    
-                # เข้าสู่โหมด PAUSE
-                self.game_state.change_state(GameStateEnum.PAUSE.value)
-                
-                # หยุดการจับเวลาชั่วคราว
-                self.statistics.stop_timer(pause=True)
+            # บันทึกว่าถึงเวลาเริ่มอัลกอริทึมแล้ว แม้อยู่ในโหมด PAUSE (update จะเริ่มให้เมื่อออกจาก PAUSE)
+            if event.type == AUTO_START_EVENT:
+                self.auto_start_due = True
+                continue
+            
+            # ตรวจสอบการกด ESC เพื่อเข้าสู่/ออกจากโหมด PAUSE
+            if event.type == _KEYDOWN and event.key == _K_ESCAPE:
+                self.__toggle_pause()
+                # อย่าให้ AUTO_START_EVENT ที่ตามมาในเฟรมเดียวกันหายไป
+                if any(e.type == AUTO_START_EVENT for e in events):
+                    self.auto_start_due = True
                 return  # ดำเนินการต่อโดยไม่ต้องทำส่วนอื่น
+            
+            # ถ้าอยู่ในโหมด PAUSE ไม่ต้องประมวลผลอีเวนต์อื่นๆ
+            if paused:
+                continue
+            
+            # Mouse movement for buttons: only the latest position matters for hover
+            if event.type == _MOUSEMOTION:
+                motion_pos = event.pos
+                continue
+            
+            handler = event_handlers.get(event.type)
+            if handler is not None:
+                handler(event)
         
-        # ถ้าอยู่ในโหมด PAUSE ไม่ต้องประมวลผลอีเวนต์อื่นๆ
-        if self.game_state.get_state() == GameStateEnum.PAUSE.value:
+        if paused:
             return
         
-        # ถ้าไม่ได้อยู่ในหน้าล็อกอิน ให้จัดการอีเวนต์ของเกมตามปกติ
-        for event in events:
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            # Handle mouse movement for buttons
-            elif event.type == pygame.MOUSEMOTION:
-                # Send camera position as well
-                self.stage.handle_mouse_motion(event.pos)
-            
-            # Handle key press for switching between placing robot/goal
-            elif event.type == pygame.KEYDOWN:
-                try:
-                    if event.key == pygame.K_SPACE:
-                        if self.game_state.get_state() == GameStateEnum.PLAYING.value:
-                            print("[GameManager] Spacebar pressed in PLAYING mode, returning to CARD_CHOOSING mode")
-                            
-                            # หยุดอัลกอริทึมที่กำลังทำงาน
-                            if hasattr(self, 'current_algorithm') and self.current_algorithm:
-                                self.current_algorithm.stop()
-                                self.current_algorithm = None
-                            
-                            # ล้างเส้นทางสีเขียว โดยไม่โหลดแผนที่ใหม่
-                            self.costmap.reset()
-                            print("[GameManager] Reset costmap, cleared path only")
-                            
-                            # เลื่อนกล้องลงและเปลี่ยนเป็นโหมด CARD_CHOOSING โดยตรง
-                            self.target_camera_y = 0
-                            self.camera_animating = True
-                            
-                            # หยุดการจับเวลา
-                            if self.statistics.is_timing:
-                                self.statistics.stop_timer()
-                                self.statistics.set_completion_success(False)
-                                # ไม่บันทึกข้อมูลเนื่องจากเป็นการยกเลิก
-                                # self.statistics.save_all_data()
-                            
-                            # เปลี่ยนสถานะเกมเป็น CARD_CHOOSING
-                            self.game_state.change_state(GameStateEnum.CARD_CHOOSING.value)
-                            
-                            # ตั้งค่าไม่ให้อยู่ในโหมดเกม
-                            self.card_deck.set_game_stage(False)
-                            
-                            # แสดงปุ่มทั้งหมดอีกครั้ง
-                            print("Showing all buttons including start and reset")
-                            for button in self.stage.buttons:
-                                button.set_visible(True)
-                                
-                        elif self.game_state.get_state() == GameStateEnum.FINISH.value:
-                            # When in FINISH mode and Space is pressed, start a new game
-                            print("[GameManager] Spacebar pressed in FINISH mode, returning to CARD_CHOOSING mode")
-                            
-                            # Store current state for later use
-                            was_successful = self.statistics.completion_success
-                            current_level = self.game_state.get_current_level()
-                            print(f"[GameManager] Level {current_level} completion: {was_successful}")
-                            
-                            # If successful, advance to next level automatically
-                            if was_successful:
-                                print("[GameManager] Successfully completed level, advancing to next level")
-                                # Advance to next level if not at max level already
-                                if current_level < 11:  # 11 is the maximum level
-                                    # Call advance_to_next_level to handle unlocking cards, etc.
-                                    self.advance_to_next_level()
-                                    # This will unlock cards, load the new map, etc.
-                                else:
-                                    print("[GameManager] Already at maximum level, not advancing")
-                            else:
-                                # Clear path and reset state
-                                self.costmap.reset()
-                            
-                            # Move camera down and change to CARD_CHOOSING mode directly
-                            self.target_camera_y = 0
-                            self.camera_animating = True
-                            
-                            # Change game state to CARD_CHOOSING
-                            self.game_state.change_state(GameStateEnum.CARD_CHOOSING.value)
-                            
-                            # Set state to not be in game mode
-                            self.card_deck.set_game_stage(False)
-                            
-                            # Show all buttons again
-                            for button in self.stage.buttons:
-                                button.set_visible(True)
-                                
-                            # Update level buttons to ensure next level is available if completed
-                            self.update_level_buttons()
-                            print(f"[GameManager] Buttons updated. Current level: {self.game_state.get_current_level()}, Highest completed: {self.game_state.highest_completed_level}")
-                    # เพิ่มปุ่ม N สำหรับเลื่อนไปด่านถัดไป (สำหรับการทดสอบ)
-                    elif event.key == pygame.K_n:
-                        self.advance_to_next_level()
-                except Exception as e:
-                    print(f"Error handling key press: {e}")
-            
-            # Handle button clicks
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                try:
-                    # แยกจัดการสำหรับปุ่มที่เป็น level_button
-                    button_clicked = False
-                    for button in self.stage.buttons:
-                        if hasattr(button, 'is_level_button') and button.is_level_button and button.is_visible:
-                            # ปุ่มเปลี่ยนระดับต้องใช้ตำแหน่งเมาส์โดยตรง ไม่ต้องปรับ offset
-                            if button.rect.collidepoint(event.pos):
-                                print(f"[GameManager] Level button clicked: {button.action_name}")
-                                self.handle_button_action(button.action_name)
-                                button_clicked = True
-                                break
-                    
-                    # ถ้ายังไม่มีการคลิกปุ่มเปลี่ยนระดับ ให้ตรวจสอบปุ่มอื่นๆ
-                    if not button_clicked:
-                        # ส่งตำแหน่งเมาส์ไปยัง stage เพื่อตรวจสอบการคลิกปุ่มอื่นๆ
-                        button_action = self.stage.handle_button_click(event.pos)
-                        if button_action:
-                            self.handle_button_action(button_action)
-                except Exception as e:
-                    print(f"Error handling button click: {e}")
-                    # Continue without crashing
+        # Update button hover once per frame, however many motion events arrived
+        if motion_pos is not None:
+            self.stage.handle_mouse_motion(motion_pos)
+        
+        # Handle card events; the deck subtracts the camera offset from mouse positions
+        self.card_deck.handle_events(events, self.camera_offset[1])
+    
+    def __on_quit(self, event):
+        """Stop the main loop when the window is closed."""
+        self.running = False
+    
+    def __on_key_down(self, event):
+        """Dispatch a key press through the KEYDOWN table."""
+        key_action = self.__key_actions.get(event.key)
+        if key_action is not None:
+            key_action()
+    
+    def __on_mouse_button_down(self, event):
+        """Handle left clicks on level buttons and stage buttons."""
+        if event.button != 1:
+            return
         
         try:
-            # Handle card events with camera offset
-            # Create new events with adjusted mouse position
-            adjusted_events = []
-            for event in events:
-                # Adjust position for mouse-related events
-                if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
-                    # Create a copy of the event
-                    adjusted_event = pygame.event.Event(event.type, dict(event.__dict__))
-                    # Adjust pos value if it exists
-                    if hasattr(adjusted_event, 'pos'):
-                        adjusted_event.pos = (
-                            adjusted_event.pos[0], 
-                            adjusted_event.pos[1] - int(self.camera_y)
-                        )
-                    adjusted_events.append(adjusted_event)
-                else:
-                    adjusted_events.append(event)
-            
-            # Send adjusted events to card_deck
-            self.card_deck.handle_events(adjusted_events)
+            # แยกจัดการสำหรับปุ่มที่เป็น level_button
+            button_clicked = False
+            for button in self.stage.buttons:
+                if hasattr(button, 'is_level_button') and button.is_level_button and button.is_visible:
+                    # ปุ่มเปลี่ยนระดับต้องใช้ตำแหน่งเมาส์โดยตรง ไม่ต้องปรับ offset
+                    if button.rect.collidepoint(event.pos):
+                        _log(f"Level button clicked: {button.action_name}")
+                        self.handle_button_action(button.action_name)
+                        button_clicked = True
+                        break
+            
+            # ถ้ายังไม่มีการคลิกปุ่มเปลี่ยนระดับ ให้ตรวจสอบปุ่มอื่นๆ
+            if not button_clicked:
+                # ส่งตำแหน่งเมาส์ไปยัง stage เพื่อตรวจสอบการคลิกปุ่มอื่นๆ
+                button_action = self.stage.handle_button_click(event.pos)
+                if button_action:
+                    self.handle_button_action(button_action)
         except Exception as e:
-            print(f"Error handling card events: {e}")
+            print(f"Error handling button click: {e}")
             # Continue without crashing
     
+    def __toggle_pause(self):
+        """Enter PAUSE mode, or return from it to the previous state."""
+        # ถ้าอยู่ในโหมด PAUSE ให้กลับไปยังสถานะก่อนหน้า
+        if self.game_state.get_state() == _STATE_PAUSE:
+            # หากกำลังเล่นอยู่ในโหมด PLAYING ก่อนจะ PAUSE
+            # ให้เริ่มจับเวลาใหม่โดยตั้งค่าเวลาเริ่มต้นใหม่
+            # การรีเซ็ตนี้ทำให้เวลาเริ่มนับต่อจากจุดที่หยุดไว้
+            self.statistics.start_timer()
+            
+            # เปลี่ยนกลับไปยังสถานะก่อนหน้า (PLAYING หรือ CARD_CHOOSING)
+            if self.camera_y > 0:
+                self.game_state.change_state(_STATE_PLAYING)
+            else:
+                self.game_state.change_state(_STATE_CARD_CHOOSING)
+            return
+            
+        # เข้าสู่โหมด PAUSE
+        self.game_state.change_state(_STATE_PAUSE)
+        
+        # หยุดการจับเวลาชั่วคราว
+        self.statistics.stop_timer(pause=True)
+    
+    def __handle_space_key(self):
+        """Leave PLAYING or FINISH mode and return to card selection."""
+        if self.game_state.get_state() == _STATE_PLAYING:
+            print("[GameManager] Spacebar pressed in PLAYING mode, returning to CARD_CHOOSING mode")
+        
+            # หยุดอัลกอริทึมที่กำลังทำงาน
+            if self.current_algorithm is not None:
+                self.current_algorithm.stop()
+                self.current_algorithm = None
+        
+            # ล้างเส้นทางสีเขียว โดยไม่โหลดแผนที่ใหม่
+            self.costmap.reset()
+            print("[GameManager] Reset costmap, cleared path only")
+        
+            # เลื่อนกล้องลงและเปลี่ยนเป็นโหมด CARD_CHOOSING โดยตรง
+            self.target_camera_y = 0
+            self.camera_animating = True
+        
+            # หยุดการจับเวลา
+            if self.statistics.is_timing:
+                self.statistics.stop_timer()
+                self.statistics.set_completion_success(False)
+                # ไม่บันทึกข้อมูลเนื่องจากเป็นการยกเลิก
+                # self.statistics.save_all_data()
+        
+            # เปลี่ยนสถานะเกมเป็น CARD_CHOOSING
+            self.game_state.change_state(_STATE_CARD_CHOOSING)
+        
+            # ตั้งค่าไม่ให้อยู่ในโหมดเกม
+            self.card_deck.set_game_stage(False)
+        
+            # แสดงปุ่มทั้งหมดอีกครั้ง
+            print("Showing all buttons including start and reset")
+            for button in self.stage.buttons:
+                button.set_visible(True)
+        
+        elif self.game_state.get_state() == _STATE_FINISH:
+            # When in FINISH mode and Space is pressed, start a new game
+            print("[GameManager] Spacebar pressed in FINISH mode, returning to CARD_CHOOSING mode")
+        
+            # Store current state for later use
+            was_successful = self.statistics.completion_success
+            current_level = self.game_state.get_current_level()
+            print(f"[GameManager] Level {current_level} completion: {was_successful}")
+        
+            # If successful, advance to next level automatically
+            if was_successful:
+                print("[GameManager] Successfully completed level, advancing to next level")
+                # Advance to next level if not at max level already
+                if current_level < 11:  # 11 is the maximum level
+                    # Call advance_to_next_level to handle unlocking cards, etc.
+                    self.advance_to_next_level()
+                    # This will unlock cards, load the new map, etc.
+                else:
+                    print("[GameManager] Already at maximum level, not advancing")
+            else:
+                # Clear path and reset state
+                self.costmap.reset()
+        
+            # Move camera down and change to CARD_CHOOSING mode directly
+            self.target_camera_y = 0
+            self.camera_animating = True
+        
+            # Change game state to CARD_CHOOSING
+            self.game_state.change_state(_STATE_CARD_CHOOSING)
+        
+            # Set state to not be in game mode
+            self.card_deck.set_game_stage(False)
+        
+            # Show all buttons again
+            for button in self.stage.buttons:
+                button.set_visible(True)
+        
+            # Update level buttons to ensure next level is available if completed
+            self.update_level_buttons()
+            print(f"[GameManager] Buttons updated. Current level: {self.game_state.get_current_level()}, Highest completed: {self.game_state.highest_completed_level}")
+    
     def handle_button_action(self, action: str):
         """Handle button clicks.
         
@@ -392,6 +517,52 @@ class GameManager:
             print(f"Error loading map: {e}")
             # Continue without crashing
             
+    def __load_level_settings(self):
+        """
+        Parse data/levels.csv once into per-level settings.
+        
+        Returns:
+            dict: Level number -> dict with int values for start_row, start_col,
+                finish_row, finish_col and time_limit (seconds)
+        """
+        level_settings = {}
+        levels_csv_path = os.path.join("data", "levels.csv")
+        
+        if not os.path.exists(levels_csv_path):
+            print(f"[GameManager] Warning: levels.csv not found at {levels_csv_path}")
+            return level_settings
+        
+        print(f"[GameManager] Reading level data from {levels_csv_path}")
+        try:
+            with open(levels_csv_path, 'r') as csvfile:
+                for row in csv.DictReader(csvfile):
+                    map_name = row['map']
+                    map_level = map_name.replace('map', '').replace('.pgm', '')
+                    try:
+                        level = int(map_level)
+                    except ValueError:
+                        print(f"[GameManager] Warning: Invalid map name format: {map_name}")
+                        continue
+                    
+                    # A bad row only loses its own level, not the rows after it
+                    try:
+                        # ตัดตัวอักษรออกจากตัวเลขของ time_limit (เช่น '10s' เป็น '10')
+                        time_limit_value = ''.join(c for c in row['time_limit'] if c.isdigit())
+                        level_settings[level] = {
+                            'start_row': int(row['start_row']),
+                            'start_col': int(row['start_col']),
+                            'finish_row': int(row['finish_row']),
+                            'finish_col': int(row['finish_col']),
+                            'time_limit': int(time_limit_value),
+                        }
+                    except (KeyError, TypeError, ValueError) as e:
+                        print(f"[GameManager] Warning: Invalid data for level {level} in levels.csv: {e}")
+        except OSError as e:
+            print(f"[GameManager] Error reading levels.csv: {e}")
+        
+        print(f"[GameManager] Found {len(level_settings)} level entries in levels.csv")
+        return level_settings
+    
     def load_current_level_map(self):
         """
         Load map for the current level and set start position, goal and time limit from levels.csv
@@ -404,32 +575,10 @@ class GameManager:
             # Update level in statistics
             self.statistics.set_level(current_level)
             
-            # Read data from levels.csv file
-            import csv
-            level_data = None
-            levels_csv_path = os.path.join("data", "levels.csv")
-            
-            if os.path.exists(levels_csv_path):
-                print(f"[GameManager] Reading level data from {levels_csv_path}")
-                with open(levels_csv_path, 'r') as csvfile:
-                    csv_reader = csv.DictReader(csvfile)
-                    # แสดงข้อมูลทั้งหมดที่อ่านได้จาก levels.csv เพื่อความชัดเจน
-                    all_rows = list(csv_reader)
-                    print(f"[GameManager] Found {len(all_rows)} level entries in levels.csv")
-                    
-                    for row in all_rows:
-                        map_name = row['map']
-                        map_level = map_name.replace('map', '').replace('.pgm', '')
-                        try:
-                            map_level_num = int(map_level)
-                            if map_level_num == current_level:
-                                level_data = row
-                                print(f"[GameManager] Found data for level {current_level}: {level_data}")
-                                break
-                        except ValueError:
-                            print(f"[GameManager] Warning: Invalid map name format: {map_name}")
-            else:
-                print(f"[GameManager] Warning: levels.csv not found at {levels_csv_path}")
+            # Look up settings parsed from levels.csv at startup
+            level_data = self.level_settings.get(current_level)
+            if level_data:
+                print(f"[GameManager] Found data for level {current_level}: {level_data}")
             
             # Create map filename based on level
             map_file = f"map{current_level}.pgm"
@@ -451,20 +600,18 @@ class GameManager:
                     # If we have data from levels.csv, set start position and goal
                     if level_data:
                         # Set robot position (start)
-                        start_row = int(level_data['start_row'])
-                        start_col = int(level_data['start_col'])
+                        start_row = level_data['start_row']
+                        start_col = level_data['start_col']
                         self.costmap.set_robot_position(start_row, start_col)
                         self.costmap.start_pos = (start_row, start_col)  # เก็บตำแหน่งเริ่มต้นไว้อ้างอิง
                         
                         # Set goal position
-                        finish_row = int(level_data['finish_row'])
-                        finish_col = int(level_data['finish_col'])
+                        finish_row = level_data['finish_row']
+                        finish_col = level_data['finish_col']
                         self.costmap.set_goal_position(finish_row, finish_col)
                         
                         # Set time limit for this level
-                        time_limit_str = level_data['time_limit']
-                        time_limit_value = ''.join(c for c in time_limit_str if c.isdigit())
-                        time_limit = int(time_limit_value)
+                        time_limit = level_data['time_limit']
                         self.statistics.set_time_limit(time_limit)
                         
                         print(f"[GameManager] Applied level {current_level} settings from levels.csv:")
@@ -514,7 +661,7 @@ class GameManager:
             self.camera_animating = True
             
             # Change game state to CARD_CHOOSING
-            self.game_state.change_state(GameStateEnum.CARD_CHOOSING.value)
+            self.game_state.change_state(_STATE_CARD_CHOOSING)
             
             # Reset all cards back to the deck using CardDeck's reset method
             self.card_deck.reset_cards()  # ใช้ reset_cards แทน reset เพื่อจัดการกับการ drag
@@ -524,19 +671,16 @@ class GameManager:
             
             # เพิ่มการตรวจสอบว่าการ์ดถูกรีเซ็ตเรียบร้อยแล้ว
             print("[GameManager] Verifying all cards reset to deck...")
-            all_slots_empty = True
-            for slot in self.stage.slots:
-                if slot.card is not None:
-                    all_slots_empty = False
-                    print(f"[GameManager] WARNING: Slot {slot.card_type.value} still has card: {slot.card.card_name}")
-                    # บังคับให้ slot.card เป็น None
-                    slot.card = None
-            
-            if all_slots_empty:
+            # บังคับให้ทุก slot ว่าง และรายงานเฉพาะ slot ที่ยังมีการ์ดค้างอยู่
+            stale_slots = self.stage.clear_slots()
+            if stale_slots:
+                for slot, card in stale_slots:
+                    print(f"[GameManager] WARNING: Slot {slot.card_type.value} still had card: {card.card_name}")
+            else:
                 print("[GameManager] All slots are empty after reset")
                 
             # หยุดและล้างอัลกอริทึมปัจจุบัน
-            if hasattr(self, 'current_algorithm') and self.current_algorithm:
+            if self.current_algorithm is not None:
                 self.current_algorithm.stop()
                 self.current_algorithm = None
                 print("[GameManager] Current algorithm stopped and cleared")
@@ -579,7 +723,7 @@ class GameManager:
         try:
             print("[GameManager] Starting game...")
             # Change game state to PLAYING
-            self.game_state.change_state(GameStateEnum.PLAYING.value)
+            self.game_state.change_state(_STATE_PLAYING)
             
             # Set state to gameplay mode
             self.card_deck.set_game_stage(True)
@@ -611,8 +755,9 @@ class GameManager:
             
             if has_cards:
                 # มีการ์ดวางอยู่ ตั้งเวลาสำหรับเริ่มอัลกอริทึมอัตโนมัติ
-                self.algorithm_start_time = time.time()
                 self.should_auto_start = True
+                self.auto_start_due = False
+                pygame.time.set_timer(AUTO_START_EVENT, self.auto_start_delay * 1000, loops=1)
                 
                 # Start timer
                 self.statistics.start_timer()
@@ -626,7 +771,7 @@ class GameManager:
                 self.should_auto_start = False
                 
                 # รีเซ็ตอัลกอริทึมเป็น None
-                if hasattr(self, 'current_algorithm') and self.current_algorithm:
+                if self.current_algorithm is not None:
                     self.current_algorithm.stop()
                 self.current_algorithm = None
                 print("[GameManager] Reset algorithm to None due to no cards placed")
@@ -641,76 +786,73 @@ class GameManager:
     
     def run_algorithm(self):
         """Run the selected algorithm."""
-        try:
-            print("[GameManager] Running algorithm...")
-            
-            # ตรวจสอบว่ามีการวางการ์ดในแต่ละช่องหรือไม่
-            has_cards = False
-            print("--------------------------------------------")
-            print("[GameManager] ตรวจสอบการ์ดในแต่ละช่อง:")
-            for i, slot in enumerate(self.stage.slots):
-                if slot.card:
-                    has_cards = True
-                    print(f"  ช่อง {i+1} ({slot.card_type.value}): {slot.card.card_name}")
-                else:
-                    print(f"  ช่อง {i+1} ({slot.card_type.value}): ว่างเปล่า (None)")
-            print("--------------------------------------------")
-                    
-            if not has_cards:
-                print("[GameManager] No cards placed in any slots, cannot start algorithm")
-                # รีเซ็ตอัลกอริทึมเป็น None เมื่อไม่มีการ์ด
-                if hasattr(self, 'current_algorithm') and self.current_algorithm:
-                    self.current_algorithm.stop()
-                    self.current_algorithm = None
-                    print("[GameManager] Reset algorithm to None due to no cards placed")
-                return
-            
-            # บันทึกอัลกอริทึมที่ใช้
-            algorithm_name, algorithm_type = self.stage.get_selected_algorithm()
-            if algorithm_name:
-                print(f"[GameManager] เลือกใช้อัลกอริทึม: {algorithm_name} ({algorithm_type})")
-                self.statistics.set_algorithm(algorithm_name, algorithm_type)
-            
-            # เรียกอัลกอริทึมจาก stage
-            print("[GameManager] กำลังเรียกใช้ run_algorithm() ของ stage...")
-            result = self.stage.run_algorithm(self.costmap, self.statistics)
-            
-            # ตรวจสอบค่าที่ได้จาก run_algorithm
-            if result is None:
-                # กรณีไม่มีการ์ดในช่อง (ไม่ใช่ error แต่ไม่มีการ์ด)
-                print("[GameManager] No cards in slots, algorithm set to None")
-                # รีเซ็ตอัลกอริทึมเป็น None
-                if hasattr(self, 'current_algorithm') and self.current_algorithm:
-                    self.current_algorithm.stop()
-                    self.current_algorithm = None
-                return
-            elif result is False:
-                # กรณีเกิดข้อผิดพลาดในการเริ่มอัลกอริทึม
-                print("[GameManager] Failed to start algorithm due to errors")
-                return
+        print("[GameManager] Running algorithm...")
+        
+        # ตรวจสอบว่ามีการวางการ์ดในแต่ละช่องหรือไม่
+        has_cards = False
+        print("--------------------------------------------")
+        print("[GameManager] ตรวจสอบการ์ดในแต่ละช่อง:")
+        for i, slot in enumerate(self.stage.slots):
+            if slot.card:
+                has_cards = True
+                print(f"  ช่อง {i+1} ({slot.card_type.value}): {slot.card.card_name}")
+            else:
+                print(f"  ช่อง {i+1} ({slot.card_type.value}): ว่างเปล่า (None)")
+        print("--------------------------------------------")
                 
-            algorithm_class, costmap = result
-            print(f"[GameManager] ได้รับคลาสอัลกอริทึม: {algorithm_class.__name__}")
+        if not has_cards:
+            print("[GameManager] No cards placed in any slots, cannot start algorithm")
+            # รีเซ็ตอัลกอริทึมเป็น None เมื่อไม่มีการ์ด
+            if self.current_algorithm is not None:
+                self.current_algorithm.stop()
+                self.current_algorithm = None
+                print("[GameManager] Reset algorithm to None due to no cards placed")
+            return
+        
+        # บันทึกอัลกอริทึมที่ใช้
+        algorithm_name, algorithm_type = self.stage.get_selected_algorithm()
+        if algorithm_name:
+            print(f"[GameManager] เลือกใช้อัลกอริทึม: {algorithm_name} ({algorithm_type})")
+            self.statistics.set_algorithm(algorithm_name, algorithm_type)
+        
+        # เรียกอัลกอริทึมจาก stage
+        print("[GameManager] กำลังเรียกใช้ run_algorithm() ของ stage...")
+        result = self.stage.run_algorithm(self.costmap, self.statistics)
+        
+        # ตรวจสอบค่าที่ได้จาก run_algorithm
+        if result is None:
+            # กรณีไม่มีการ์ดในช่อง (ไม่ใช่ error แต่ไม่มีการ์ด)
+            print("[GameManager] No cards in slots, algorithm set to None")
+            # รีเซ็ตอัลกอริทึมเป็น None
+            if self.current_algorithm is not None:
+                self.current_algorithm.stop()
+                self.current_algorithm = None
+            return
+        elif result is False:
+            # กรณีเกิดข้อผิดพลาดในการเริ่มอัลกอริทึม
+            print("[GameManager] Failed to start algorithm due to errors")
+            return
             
-            # สร้างอินสแตนซ์ของอัลกอริทึม
-            print("[GameManager] กำลังสร้างอินสแตนซ์ของอัลกอริทึม...")
+        algorithm_class, costmap = result
+        print(f"[GameManager] ได้รับคลาสอัลกอริทึม: {algorithm_class.__name__}")
+        
+        # สร้างอินสแตนซ์ของอัลกอริทึมและเริ่มทำงาน (การวางแผนเส้นทางอาจล้มเหลวได้)
+        print("[GameManager] กำลังสร้างอินสแตนซ์ของอัลกอริทึม...")
+        try:
             self.current_algorithm = algorithm_class(costmap)
-            
-            # เริ่มอัลกอริทึม
             print("[GameManager] กำลังเริ่มอัลกอริทึม...")
             success = self.current_algorithm.start()
-            if not success:
-                print("[GameManager] Failed to start algorithm")
-                self.current_algorithm = None
-                return
-                
-            print("--------------------------------------------")
-            print(f"Running algorithm {algorithm_name}, please wait...")
-            print("--------------------------------------------")
-            
         except Exception as e:
             print(f"Error running algorithm: {e}")
-            # Continue without crashing
+            success = False
+        if not success:
+            print("[GameManager] Failed to start algorithm")
+            self.current_algorithm = None
+            return
+            
+        print("--------------------------------------------")
+        print(f"Running algorithm {algorithm_name}, please wait...")
+        print("--------------------------------------------")
     
     def on_algorithm_complete(self, success, path_length=0):
         """Handle completion of algorithm (robot reached goal or failed)."""
@@ -741,7 +883,7 @@ class GameManager:
                 self.player_data.save_player_data(self.game_state.get_username())
             
             # Change to FINISH state after processing completion
-            self.game_state.change_state(GameStateEnum.FINISH.value)
+            self.game_state.change_state(_STATE_FINISH)
             print(f"[GameManager] State changed to FINISH. Success: {success}")
             
             # Update level buttons to reflect new state - important for showing next level button
@@ -762,403 +904,394 @@ class GameManager:
             # If error occurs, still set completion status to ensure proper display
             self.statistics.set_completion_success(success)
             # Ensure we change to FINISH state even if there's an error
-            self.game_state.change_state(GameStateEnum.FINISH.value)
+            self.game_state.change_state(_STATE_FINISH)
     
-    def update(self):
-        """Update the game state."""
-        try:
-            # If in login screen, update login screen only
-            if self.game_state.get_state() == GameStateEnum.LOGIN.value:
-                self.login_screen.update()
-                return
-                
-            # If in PAUSE mode, don't update anything
-            if self.game_state.get_state() == GameStateEnum.PAUSE.value:
-                return
+    def update(self, dt=1 / 60):
+        """Update the game state.
+        
+        Args:
+            dt (float): Seconds elapsed since the previous frame
+        """
+        # If in login screen, update login screen only
+        if self.game_state.get_state() == _STATE_LOGIN:
+            self.login_screen.update()
+            return
+            
+        # If in PAUSE mode, don't update anything
+        if self.game_state.get_state() == _STATE_PAUSE:
+            return
+            
+        # Update camera animation
+        if self.camera_animating:
+            diff = self.target_camera_y - self.camera_y
+            if abs(diff) > 0.5:
+                # Exponential approach so the speed does not depend on the frame rate
+                self.camera_y += diff * (1.0 - math.exp(-self.camera_speed * dt))
+            else:
+                self.camera_y = self.target_camera_y
+                self.camera_animating = False
                 
-            # Update camera animation
-            if self.camera_animating:
-                diff = self.target_camera_y - self.camera_y
-                if abs(diff) > 0.5:
-                    self.camera_y += diff * self.camera_speed
-                else:
-                    self.camera_y = self.target_camera_y
-                    self.camera_animating = False
+                # Set game state based on camera position
+                if self.camera_y > 0 and self.game_state.get_state() == _STATE_CARD_CHOOSING:
+                    self.game_state.change_state(_STATE_PLAYING)
+                    print("[GameManager] State changed to PLAYING")
                     
-                    # Set game state based on camera position
-                    if self.camera_y > 0 and self.game_state.get_state() == GameStateEnum.CARD_CHOOSING.value:
-                        self.game_state.change_state(GameStateEnum.PLAYING.value)
-                        print("[GameManager] State changed to PLAYING")
-                        
-                        # ตรวจสอบและรีเซ็ตตำแหน่งหุ่นยนต์ถ้าไม่ได้อยู่ที่จุดเริ่มต้น
-                        self.__check_and_reset_robot_position()
-                        
-                    elif self.camera_y <= 0 and self.game_state.get_state() == GameStateEnum.PLAYING.value:
-                        self.game_state.change_state(GameStateEnum.CARD_CHOOSING.value)
-                        print("[GameManager] State changed to CARD_CHOOSING")
+                    # ตรวจสอบและรีเซ็ตตำแหน่งหุ่นยนต์ถ้าไม่ได้อยู่ที่จุดเริ่มต้น
+                    self.__check_and_reset_robot_position()
+                    
+                elif self.camera_y <= 0 and self.game_state.get_state() == _STATE_PLAYING:
+                    self.game_state.change_state(_STATE_CARD_CHOOSING)
+                    print("[GameManager] State changed to CARD_CHOOSING")
             
-            # Check if algorithm should auto-start
-            if self.should_auto_start and time.time() - self.algorithm_start_time >= self.auto_start_delay:
+            self.camera_offset = (0, int(self.camera_y))
+        
+        # Check if algorithm should auto-start
+        if self.auto_start_due:
+            self.auto_start_due = False
+            if self.should_auto_start:
                 self.should_auto_start = False
                 self.run_algorithm()
+            
+        # Update game state
+        self.game_state.update()
+        
+        # Update cards
+        self.card_deck.update()
+        
+        # Check time limit when in PLAYING mode
+        if self.game_state.get_state() == _STATE_PLAYING and self.statistics.is_timing:
+            # แน่ใจว่าใช้ time limit ที่ถูกต้องอยู่เสมอ
+            correct_time_limit = self.__get_correct_time_limit_for_level()
+            if correct_time_limit and correct_time_limit != self.statistics.time_limit:
+                print(f"[GameManager] Time limit was incorrect: {self.statistics.time_limit}, updating to {correct_time_limit}")
+                self.statistics.set_time_limit(correct_time_limit)
+            
+            elapsed_time = self.statistics.get_elapsed_time()
+            time_limit = self.statistics.get_time_limit()
+            
+            # If time exceeds limit, stop game and show failure
+            if elapsed_time > time_limit:
+                print(f"[GameManager] Time limit exceeded: {elapsed_time:.2f}/{time_limit} seconds")
+                
+                # Stop running algorithm
+                if self.current_algorithm is not None:
+                    self.current_algorithm.stop()
+                    self.current_algorithm.is_completed = False
+                    
+                # Call callback when algorithm completes (failure)
+                self.on_algorithm_complete(False, 0)
                 
-            # Update game state
-            self.game_state.update()
-            
-            # Update cards
-            self.card_deck.update()
-            
-            # Check time limit when in PLAYING mode
-            if self.game_state.get_state() == GameStateEnum.PLAYING.value and self.statistics.is_timing:
-                # แน่ใจว่าใช้ time limit ที่ถูกต้องอยู่เสมอ
-                correct_time_limit = self.__get_correct_time_limit_for_level()
-                if correct_time_limit and correct_time_limit != self.statistics.time_limit:
-                    print(f"[GameManager] Time limit was incorrect: {self.statistics.time_limit}, updating to {correct_time_limit}")
-                    self.statistics.set_time_limit(correct_time_limit)
+                # Clear algorithm instance
+                self.current_algorithm = None
+        
+        # Update level buttons status
+        if self.game_state.get_state() == _STATE_CARD_CHOOSING:
+            self.update_level_buttons()
+            
+        # Update algorithm if running
+        if self.current_algorithm is not None and self.game_state.get_state() == _STATE_PLAYING:
+            # Update algorithm state
+            still_running = self.current_algorithm.update()
+            
+            # Record robot position if moved
+            if self.costmap.robot_pos:
+                self.statistics.add_robot_position(
+                    self.costmap.robot_pos[0], 
+                    self.costmap.robot_pos[1]
+                )
+            
+            # Check if robot has reached the goal
+            if self.costmap.robot_pos and self.costmap.goal_pos:
+                robot_row, robot_col = self.costmap.robot_pos
+                goal_row, goal_col = self.costmap.goal_pos
                 
-                elapsed_time = self.statistics.get_elapsed_time()
-                time_limit = self.statistics.get_time_limit()
+                # คำนวณระยะห่างโดยใช้ทั้ง Manhattan distance และ Euclidean distance
+                manhattan_dist = abs(robot_row - goal_row) + abs(robot_col - goal_col)
+                euclidean_dist = ((robot_row - goal_row)**2 + (robot_col - goal_col)**2)**0.5
                 
-                # If time exceeds limit, stop game and show failure
-                if elapsed_time > time_limit:
-                    print(f"[GameManager] Time limit exceeded: {elapsed_time:.2f}/{time_limit} seconds")
+                # ใช้เกณฑ์ที่เข้มงวดกว่าเดิม - ต้องใกล้เป้าหมายจริงๆ
+                if manhattan_dist <= 1 and euclidean_dist <= 1.0:
+                    print(f"[GameManager] Robot reached goal! Manhattan distance: {manhattan_dist}, Euclidean distance: {euclidean_dist:.2f}")
                     
-                    # Stop running algorithm
-                    if hasattr(self, 'current_algorithm') and self.current_algorithm:
-                        self.current_algorithm.stop()
-                        self.current_algorithm.is_completed = False
-                        
-                    # Call callback when algorithm completes (failure)
-                    self.on_algorithm_complete(False, 0)
+                    # Force algorithm to stop running
+                    self.current_algorithm.is_running = False
+                    still_running = False
                     
-                    # Clear algorithm instance
-                    self.current_algorithm = None
-            
-            # Update level buttons status
-            if self.game_state.get_state() == GameStateEnum.CARD_CHOOSING.value:
-                self.update_level_buttons()
+                    # Mark algorithm as completed
+                    self.current_algorithm.is_completed = True
+                    
+                    # Create path if none exists
+                    if not hasattr(self.current_algorithm, 'path') or not self.current_algorithm.path:
+                        self.current_algorithm.path = [(robot_row, robot_col)]
+                elif not still_running and not self.current_algorithm.is_completed:
+                    # ถ้าอัลกอริทึมหยุดทำงานแล้วแต่ยังไม่ถึงเป้าหมาย
+                    print(f"[GameManager] Algorithm stopped but goal not reached! Manhattan distance: {manhattan_dist}, Euclidean distance: {euclidean_dist:.2f}")
+                    self.current_algorithm.is_completed = False
+            
+            # If algorithm has stopped, complete the level
+            if not still_running:
+                print("[GameManager] Algorithm completed or stopped.")
                 
-            # Update algorithm if running
-            if hasattr(self, 'current_algorithm') and self.current_algorithm and self.game_state.get_state() == GameStateEnum.PLAYING.value:
-                # Update algorithm state
-                still_running = self.current_algorithm.update()
+                # Call callback when algorithm completes
+                success = self.current_algorithm.is_completed
+                path_length = len(self.current_algorithm.path) if hasattr(self.current_algorithm, 'path') else 0
+                self.on_algorithm_complete(success, path_length)
                 
-                # Record robot position if moved
-                if self.costmap.robot_pos:
-                    self.statistics.add_robot_position(
-                        self.costmap.robot_pos[0], 
-                        self.costmap.robot_pos[1]
-                    )
+                # Clear algorithm instance
+                self.current_algorithm = None
                 
-                # Check if robot has reached the goal
-                if self.costmap.robot_pos and self.costmap.goal_pos:
-                    robot_row, robot_col = self.costmap.robot_pos
-                    goal_row, goal_col = self.costmap.goal_pos
-                    
-                    # คำนวณระยะห่างโดยใช้ทั้ง Manhattan distance และ Euclidean distance
-                    manhattan_dist = abs(robot_row - goal_row) + abs(robot_col - goal_col)
-                    euclidean_dist = ((robot_row - goal_row)**2 + (robot_col - goal_col)**2)**0.5
-                    
-                    # ใช้เกณฑ์ที่เข้มงวดกว่าเดิม - ต้องใกล้เป้าหมายจริงๆ
-                    if manhattan_dist <= 1 and euclidean_dist <= 1.0:
-                        print(f"[GameManager] Robot reached goal! Manhattan distance: {manhattan_dist}, Euclidean distance: {euclidean_dist:.2f}")
-                        
-                        # Force algorithm to stop running
-                        self.current_algorithm.is_running = False
-                        still_running = False
-                        
-                        # Mark algorithm as completed
-                        self.current_algorithm.is_completed = True
-                        
-                        # Create path if none exists
-                        if not hasattr(self.current_algorithm, 'path') or not self.current_algorithm.path:
-                            self.current_algorithm.path = [(robot_row, robot_col)]
-                    elif not still_running and not self.current_algorithm.is_completed:
-                        # ถ้าอัลกอริทึมหยุดทำงานแล้วแต่ยังไม่ถึงเป้าหมาย
-                        print(f"[GameManager] Algorithm stopped but goal not reached! Manhattan distance: {manhattan_dist}, Euclidean distance: {euclidean_dist:.2f}")
-                        self.current_algorithm.is_completed = False
+                # Show message if successful
+                if success:
+                    print(f"[GameManager] Completed level {self.game_state.get_current_level()}!")
                 
-                # If algorithm has stopped, complete the level
-                if not still_running:
-                    print("[GameManager] Algorithm completed or stopped.")
-                    
-                    # Call callback when algorithm completes
-                    success = self.current_algorithm.is_completed
-                    path_length = len(self.current_algorithm.path) if hasattr(self.current_algorithm, 'path') else 0
-                    self.on_algorithm_complete(success, path_length)
-                    
-                    # Clear algorithm instance
-                    self.current_algorithm = None
-                    
-                    # Show message if successful
-                    if success:
-                        print(f"[GameManager] Completed level {self.game_state.get_current_level()}!")
-                    
-            # Update card unlock notification display
-            if self.new_cards_notification:
-                if time.time() - self.notification_start_time >= self.notification_duration:
-                    self.new_cards_notification = False
-        except Exception as e:
-            print(f"Error updating game: {e}")
-            # Continue without crashing
+        # Update card unlock notification display
+        if self.new_cards_notification:
+            if time.time() - self.notification_start_time >= self.notification_duration:
+                self.new_cards_notification = False
     
     def draw(self):
         """Draw all game elements."""
-        try:
-            # Clear the screen
-            self.screen.fill(Config.BACKGROUND_COLOR)
-            
-            # If in login screen, draw login screen only
-            if self.game_state.get_state() == GameStateEnum.LOGIN.value:
-                self.login_screen.draw(self.screen)
-                pygame.display.flip()
-                return
-                
-            # Find card being dragged
-            dragging_card = None
-            for card in self.card_deck.cards:
-                if card.dragging:
-                    dragging_card = card
-                    break
-            
-            # Create offset for drawing everything based on camera position
-            camera_offset = (0, self.camera_y)
-            
-            # Draw stage first (background and slots) with camera offset
-            self.stage.draw(self.screen, dragging_card, camera_offset)
-            
-            # Draw game elements with camera offset
-            self.card_deck.draw(self.screen, camera_offset)
-            
-            # Draw rectangle for game screen
-            # Adjust position according to camera_offset
-            rect_start = (147, -368 + self.camera_y)
-            rect_end = (1054, 87 + self.camera_y)
-            rect_width = rect_end[0] - rect_start[0]
-            rect_height = rect_end[1] - rect_start[1]
-            
-            # สร้าง surface ชั่วคราวสำหรับวาดแผนที่
-            map_surface = pygame.Surface((rect_width, rect_height), pygame.SRCALPHA)
-            map_surface.fill((0, 0, 0, 0))  # ทำให้โปร่งใสทั้งหมด
-            
-            # วาดแผนที่ลงบน surface ชั่วคราว (ปรับตำแหน่งให้เป็น 0,0)
-            self.costmap.draw(map_surface, (0, 0))
-            
-            # สร้าง mask สำหรับ clipping
-            mask = pygame.Surface((rect_width, rect_height), pygame.SRCALPHA)
-            mask.fill((0, 0, 0, 0))  # ทำให้โปร่งใสทั้งหมด
-            
-            # วาดสี่เหลี่ยมบน mask ด้วยขอบมน
-            pygame.draw.rect(
-                mask, 
-                (255, 255, 255, 255),  # สีขาวทึบ 
-                (0, 0, rect_width, rect_height),
-                0,  # ความหนา 0 คือเติมสีทั้งหมด
-                border_radius=10  # ขอบมน
-            )
-            
-            # ใช้ mask กับ map_surface (ทำ clipping)
-            map_surface.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+        # If in login screen, draw login screen only
+        if self.game_state.get_state() == _STATE_LOGIN:
+            self.screen.fill(self.background_color)
+            self.login_screen.draw(self.screen)
+            pygame.display.flip()
+            return
             
-            # นำแผนที่ไปวาดบนหน้าจอหลัก ตามตำแหน่งที่ต้องการ
-            self.screen.blit(map_surface, rect_start)
-            
-            # Draw border in white, 3 pixels thick
-            pygame.draw.rect(
-                self.screen, 
-                Config.WHITE_COLOR, 
-                (rect_start[0], rect_start[1], rect_width, rect_height),
-                3,  # Border thickness
-                border_radius=10  # Rounded corners
-            )
-            
-            # Draw buttons separately
-            for button in self.stage.buttons:
-                if hasattr(button, 'is_level_button') and button.is_level_button:
-                    # Level buttons should always stay at fixed position on top
-                    # แสดงปุ่มเปลี่ยนแมพเฉพาะเมื่อกล้องอยู่ด้านบน (camera_y > 150) 
-                    # หรืออยู่ในสถานะ PLAYING เท่านั้น
-                    if self.camera_y > 150 or self.game_state.get_state() == GameStateEnum.PLAYING.value:
-                        # วาดปุ่มในตำแหน่งปกติโดยไม่คำนึงถึงตำแหน่งของกล้อง
-                        original_pos = button.position
-                        button.rect.center = original_pos  # ตำแหน่งเดิมของปุ่ม ไม่ขึ้นกับกล้อง
-                        button.draw(self.screen)
-                else:
-                    # Other buttons move with camera
-                    button.draw(self.screen, camera_offset)
-            
-            # Display information only when camera is at the top (camera_y > 0)
-            # Do not display information when camera moves down (camera_y <= 0)
-            if self.camera_y > 150:  # เปลี่ยนจาก 0 เป็น 150 เพื่อให้ข้อมูลหายเร็วขึ้น
-                # Display information at normal position
-                current_level = self.game_state.get_current_level()
-                username = self.game_state.get_username()
-                elapsed_time = self.statistics.get_elapsed_time()
-                formatted_time = self.statistics.format_time(elapsed_time)
-                font = pygame.font.Font("font/PixelifySans-SemiBold.ttf", 36)
-                
-                # Display level number (left)
-                level_text = font.render(f"Level {current_level}", True, Config.WHITE_COLOR)
-                self.screen.blit(level_text, (20, 20))
+        # Card being dragged (tracked by the deck)
+        dragging_card = self.card_deck.dragging_card
+        
+        # Offset for drawing everything based on camera position
+        camera_offset = self.camera_offset
+        
+        # The board background is opaque, so clear the screen only when it leaves part of the window uncovered
+        if not self.stage.background.get_rect(topleft=camera_offset).contains(self.screen_rect):
+            self.screen.fill(self.background_color)
+        
+        # Draw stage first (background and slots) with camera offset
+        self.stage.draw(self.screen, dragging_card, camera_offset)
+        
+        # Draw game elements with camera offset
+        self.card_deck.draw(self.screen, camera_offset)
+        
+        # Draw rectangle for game screen
+        # Adjust position according to camera_offset
+        map_rect = self.map_panel_rect.move(camera_offset)
+        
+        # Skip the map panel entirely while it is scrolled off-screen
+        if self.screen_rect.colliderect(map_rect):
+            # สร้างแผนที่ที่ตัดขอบมนใหม่เฉพาะเมื่อ costmap เปลี่ยน
+            map_key = self.costmap.render_key
+            if self.map_panel_surface is None or map_key != self.map_panel_key:
+                map_surface = pygame.Surface(map_rect.size, pygame.SRCALPHA)
+                map_surface.fill((0, 0, 0, 0))  # ทำให้โปร่งใสทั้งหมด
                 
-                # Display player name (right)
-                username_text = font.render(f"Player: {username}", True, Config.WHITE_COLOR)
-                username_rect = username_text.get_rect(topright=(self.window_width - 20, 20))
-                self.screen.blit(username_text, username_rect)
+                # วาดแผนที่ลงบน surface (ปรับตำแหน่งให้เป็น 0,0)
+                self.costmap.draw(map_surface, (0, 0))
                 
-                # Display elapsed time (center)
-                timer_bg = pygame.Surface((350, 45), pygame.SRCALPHA)  # Increased width from 200 to 350
-                timer_bg.fill((0, 0, 0, 128))
-                timer_rect = timer_bg.get_rect(centerx=self.window_width // 2, top=20)
-                self.screen.blit(timer_bg, timer_rect)
+                # ใช้ mask ขอบมนที่สร้างไว้แล้วกับ map_surface (ทำ clipping)
+                map_surface.blit(self.map_panel_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
                 
-                # Display elapsed time and time limit
-                time_limit = self.statistics.get_time_limit()
-                # ตรวจสอบอีกครั้งว่า time_limit ที่จะแสดงถูกต้อง
-                correct_time_limit = self.__get_correct_time_limit_for_level()
-                if correct_time_limit and correct_time_limit != time_limit:
-                    print(f"[GameManager] Time limit was incorrect in display: {time_limit}, should be {correct_time_limit}")
-                    self.statistics.set_time_limit(correct_time_limit)
-                    time_limit = correct_time_limit
+                self.map_panel_surface = map_surface
+                self.map_panel_key = map_key
+            
+            # นำแผนที่ไปวาดบนหน้าจอหลัก ตามตำแหน่งที่ต้องการ
+            self.screen.blit(self.map_panel_surface, map_rect)
+            
+            # Pre-rendered white border, 3 pixels thick with rounded corners
+            self.screen.blit(self.map_panel_border, map_rect)
+        
+        # Draw buttons separately
+        for button in self.stage.buttons:
+            if hasattr(button, 'is_level_button') and button.is_level_button:
+                # Level buttons should always stay at fixed position on top
+                # แสดงปุ่มเปลี่ยนแมพเฉพาะเมื่อกล้องอยู่ด้านบน (camera_y > 150) 
+                # หรืออยู่ในสถานะ PLAYING เท่านั้น
+                if self.camera_y > 150 or self.game_state.get_state() == _STATE_PLAYING:
+                    # วาดปุ่มในตำแหน่งปกติโดยไม่คำนึงถึงตำแหน่งของกล้อง
+                    original_pos = button.position
+                    button.rect.center = original_pos  # ตำแหน่งเดิมของปุ่ม ไม่ขึ้นกับกล้อง
+                    button.draw(self.screen)
+            else:
+                # Other buttons move with camera
+                button.draw(self.screen, camera_offset)
+        
+        # Display information only when camera is at the top (camera_y > 0)
+        # Do not display information when camera moves down (camera_y <= 0)
+        if self.camera_y > 150:  # เปลี่ยนจาก 0 เป็น 150 เพื่อให้ข้อมูลหายเร็วขึ้น
+            # Display information at normal position
+            current_level = self.game_state.get_current_level()
+            username = self.game_state.get_username()
+            elapsed_time = self.statistics.get_elapsed_time()
+            formatted_time = self.statistics.format_time(elapsed_time)
+            
+            # Display level number (left)
+            level_text = self.__render_hud_label(36, f"Level {current_level}", self.text_color)
+            self.screen.blit(level_text, (20, 20))
+            
+            # Display player name (right)
+            username_text = self.__render_hud_label(36, f"Player: {username}", self.text_color)
+            username_rect = username_text.get_rect(topright=(self.window_width - 20, 20))
+            self.screen.blit(username_text, username_rect)
+            
+            # Display elapsed time (center)
+            timer_rect = self.timer_bg.get_rect(centerx=self.window_width // 2, top=20)
+            self.screen.blit(self.timer_bg, timer_rect)
+            
+            # Display elapsed time and time limit
+            time_limit = self.statistics.get_time_limit()
+            # ตรวจสอบอีกครั้งว่า time_limit ที่จะแสดงถูกต้อง
+            correct_time_limit = self.__get_correct_time_limit_for_level()
+            if correct_time_limit and correct_time_limit != time_limit:
+                print(f"[GameManager] Time limit was incorrect in display: {time_limit}, should be {correct_time_limit}")
+                self.statistics.set_time_limit(correct_time_limit)
+                time_limit = correct_time_limit
 
-                timer_text = self.timer_font.render(f"{formatted_time} / {self.statistics.format_time(time_limit)}", True, Config.WHITE_COLOR)
-                timer_text_rect = timer_text.get_rect(center=timer_rect.center)
-                self.screen.blit(timer_text, timer_text_rect)
-                
-                # If time exceeded, show warning in red
-                if elapsed_time > time_limit and self.game_state.get_state() == GameStateEnum.PLAYING.value:
-                    time_warning = self.timer_font.render("Time Exceeded!", True, (255, 0, 0))
-                    warning_rect = time_warning.get_rect(centerx=self.window_width // 2, top=timer_rect.bottom + 10)
-                    self.screen.blit(time_warning, warning_rect)
+            self.__blit_timer_text(f"{formatted_time} / {self.statistics.format_time(time_limit)}", timer_rect.center)
+            
+            # If time exceeded, show warning in red
+            if elapsed_time > time_limit and self.game_state.get_state() == _STATE_PLAYING:
+                time_warning = self.__render_hud_label(36, "Time Exceeded!", (255, 0, 0))
+                warning_rect = time_warning.get_rect(centerx=self.window_width // 2, top=timer_rect.bottom + 10)
+                self.screen.blit(time_warning, warning_rect)
+            
+            # If in FINISH mode, show additional message
+            if self.game_state.get_state() == _STATE_FINISH:
+                # Dim the screen with the transparent black overlay
+                self.screen.blit(self.finish_overlay, (0, 0))
                 
-                # If in FINISH mode, show additional message
-                if self.game_state.get_state() == GameStateEnum.FINISH.value:
-                    # Create transparent black background to dim the screen
-                    overlay = pygame.Surface((self.window_width, self.window_height), pygame.SRCALPHA)
-                    overlay.fill((0, 0, 0, 180))  # Transparent black (alpha 180/255)
-                    self.screen.blit(overlay, (0, 0))
-                    
-                    result_font = pygame.font.Font("font/PixelifySans-SemiBold.ttf", 48)
-                    # Use completion_success from statistics for display
-                    if self.statistics.completion_success:
-                        result_text = result_font.render("Success!", True, (0, 255, 0))
-                    else:
-                        result_text = result_font.render("Failed!", True, (255, 0, 0))
-                    result_rect = result_text.get_rect(center=(self.window_width // 2, self.window_height // 2))
-                    self.screen.blit(result_text, result_rect)
-                    
-                    hint_font = pygame.font.Font("font/PixelifySans-SemiBold.ttf", 24)
-                    hint_text = hint_font.render("Press SPACE to continue", True, Config.WHITE_COLOR)
-                    hint_rect = hint_text.get_rect(center=(self.window_width // 2, self.window_height // 2 + 60))
-                    self.screen.blit(hint_text, hint_rect)
-            
-            # Display new card unlocked notification
-            if self.new_cards_notification and self.new_cards:
-                self.draw_new_cards_notification()
-                
-            # If in PAUSE mode, show message
-            if self.game_state.get_state() == GameStateEnum.PAUSE.value:
-                # Create transparent background
-                pause_bg = pygame.Surface((self.window_width, self.window_height), pygame.SRCALPHA)
-                pause_bg.fill((0, 0, 0, 150))  # Transparent black
-                self.screen.blit(pause_bg, (0, 0))
-                
-                # Show PAUSE text
-                pause_font = pygame.font.Font("font/PixelifySans-SemiBold.ttf", 72)
-                pause_text = pause_font.render("PAUSE", True, Config.WHITE_COLOR)
-                pause_rect = pause_text.get_rect(center=(self.window_width // 2, self.window_height // 2))
-                self.screen.blit(pause_text, pause_rect)
+                # Use completion_success from statistics for display
+                if self.statistics.completion_success:
+                    result_text = self.__render_hud_label(48, "Success!", (0, 255, 0))
+                else:
+                    result_text = self.__render_hud_label(48, "Failed!", (255, 0, 0))
+                result_rect = result_text.get_rect(center=(self.window_width // 2, self.window_height // 2))
+                self.screen.blit(result_text, result_rect)
                 
-                # Show instruction
-                hint_font = pygame.font.Font("font/PixelifySans-SemiBold.ttf", 24)
-                hint_text = hint_font.render("Press ESC to continue", True, Config.WHITE_COLOR)
+                hint_text = self.__render_hud_label(24, "Press SPACE to continue", self.text_color)
                 hint_rect = hint_text.get_rect(center=(self.window_width // 2, self.window_height // 2 + 60))
                 self.screen.blit(hint_text, hint_rect)
+        
+        # Display new card unlocked notification
+        if self.new_cards_notification and self.new_cards:
+            self.draw_new_cards_notification()
+            
+        # If in PAUSE mode, show message
+        if self.game_state.get_state() == _STATE_PAUSE:
+            # Dim the screen with the transparent background
+            self.screen.blit(self.pause_overlay, (0, 0))
+            
+            # Show PAUSE text
+            pause_text = self.__render_hud_label(72, "PAUSE", self.text_color)
+            pause_rect = pause_text.get_rect(center=(self.window_width // 2, self.window_height // 2))
+            self.screen.blit(pause_text, pause_rect)
+            
+            # Show instruction
+            hint_text = self.__render_hud_label(24, "Press ESC to continue", self.text_color)
+            hint_rect = hint_text.get_rect(center=(self.window_width // 2, self.window_height // 2 + 60))
+            self.screen.blit(hint_text, hint_rect)
+        
+        # Update the display
+        pygame.display.flip()
+    
+    def __render_hud_label(self, size, text, color):
+        """
+        Return a cached rendering of a HUD label.
+        
+        Args:
+            size (int): Font size in points
+            text (str): Label text
+            color (tuple): RGB text color
             
-            # Update the display
-            pygame.display.flip()
-        except Exception as e:
-            print(f"Error drawing game: {e}")
-            # Continue without crashing
-            
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        key = (size, text, color)
+        surface = self.__hud_labels.get(key)
+        if surface is None:
+            font = self.__hud_fonts.get(size)
+            if font is None:
+                font = pygame.font.Font("font/PixelifySans-SemiBold.ttf", size)
+                self.__hud_fonts[size] = font
+            surface = font.render(text, True, color)
+            self.__hud_labels[key] = surface
+        return surface
+    
+    def __blit_timer_text(self, text, center):
+        """
+        Draw the timer readout from cached per-character glyphs.
+        
+        The readout changes every frame (milliseconds), so whole strings are not
+        worth caching; its alphabet (digits, ':', '.', ' ', '/') is tiny instead.
+        Glyphs are placed by their own widths, so pair kerning is not applied.
+        
+        Args:
+            text (str): Timer text, e.g. "00:12.345 / 00:15.000"
+            center (tuple): Screen position to center the text on
+        """
+        glyph_cache = self.__timer_glyphs
+        color = self.text_color
+        glyphs = []
+        width = 0
+        for char in text:
+            glyph = glyph_cache.get((char, color))
+            if glyph is None:
+                glyph = self.timer_font.render(char, True, color)
+                glyph_cache[(char, color)] = glyph
+            glyphs.append(glyph)
+            width += glyph.get_width()
+        
+        x = center[0] - width // 2
+        y = center[1] - self.timer_font.get_height() // 2
+        for glyph in glyphs:
+            self.screen.blit(glyph, (x, y))
+            x += glyph.get_width()
+    
     def draw_new_cards_notification(self):
         """Display notification for newly unlocked cards"""
-        try:
-            # Check and display completion_success status for debugging
-            print(f"[GameManager] Current completion_success: {self.statistics.completion_success}")
-            
-            # Create background for notification
-            notification_width = 600  # Increased from 500 to 600
-            notification_height = 400  # Increased from 300 to 400
-            
-            # Calculate center position of screen
-            screen_width, screen_height = self.screen.get_size()
-            x_pos = (screen_width - notification_width) // 2
-            y_pos = (screen_height - notification_height) // 2
-            
-            # Create transparent background
-            notification_bg = pygame.Surface((notification_width, notification_height), pygame.SRCALPHA)
-            notification_bg.fill((0, 0, 0, 180))  # Transparent black
-            
-            # Display background
-            self.screen.blit(notification_bg, (x_pos, y_pos))
-            
-            # Display title text
-            font_title = pygame.font.Font("font/PixelifySans-SemiBold.ttf", 36)
-            title_text = font_title.render("New Cards Unlocked!", True, Config.WHITE_COLOR)
-            title_rect = title_text.get_rect(centerx=screen_width//2, top=y_pos + 20)
-            self.screen.blit(title_text, title_rect)
-            
-            # Card descriptions based on type and name
-            card_descriptions = {
-                "Navigation": {
-                    "DFS": "Depth-First Search: Explores as far as possible along branches before backtracking.",
-                    "BFS": "Breadth-First Search: Explores all neighbors at current depth before moving deeper.",
-                    "Dijkstra": "Dijkstra's Algorithm: Finds shortest path using a priority queue based on distance.",
-                    "AStar": "A* Search: Uses heuristics to find shortest path more efficiently than Dijkstra.",
-                    "RRT": "Rapidly-exploring Random Tree: Efficiently explores large areas by random sampling."
-                },
-                "Collision avoidance": {
-                    "VFH": "Vector Field Histogram: Avoids obstacles using local environment representation.",
-                    "BUG": "Bug Algorithm: Simple approach that follows obstacles until path is clear."
-                },
-                "Recovery": {
-                    "SpinInPlace": "Spin In Place: Rotates in place to find a new valid path.",
-                    "StepBack": "Step Back: Moves backward to recover from obstacles."
-                }
-            }
-            
-            # Display list of unlocked cards with descriptions
-            font_card = pygame.font.Font("font/PixelifySans-SemiBold.ttf", 24)
-            font_desc = pygame.font.Font("font/PixelifySans-SemiBold.ttf", 16)
-            y_offset = 80
-            
-            for i, card_info in enumerate(self.new_cards):
-                card_type = card_info['type']
-                card_name = card_info['name']
-                
-                # Card name with type
-                card_text = font_card.render(f"{card_type}: {card_name}", True, Config.WHITE_COLOR)
-                card_rect = card_text.get_rect(centerx=screen_width//2, top=y_pos + y_offset)
-                self.screen.blit(card_text, card_rect)
-                
-                # Card description
-                if card_type in card_descriptions and card_name in card_descriptions[card_type]:
-                    desc_text = font_desc.render(card_descriptions[card_type][card_name], True, (200, 200, 200))
-                    desc_rect = desc_text.get_rect(centerx=screen_width//2, top=y_pos + y_offset + 30)
-                    self.screen.blit(desc_text, desc_rect)
-                    
-                y_offset += 70  # Increased spacing between cards
+        # Check and display completion_success status for debugging
+        _log(f"Current completion_success: {self.statistics.completion_success}", level=3)
+        
+        # Background for notification
+        notification_width, notification_height = self.notification_bg.get_size()
+        
+        # Calculate center position of screen
+        screen_width, screen_height = self.screen.get_size()
+        x_pos = (screen_width - notification_width) // 2
+        y_pos = (screen_height - notification_height) // 2
+        
+        # Display background
+        self.screen.blit(self.notification_bg, (x_pos, y_pos))
+        
+        # Display title text
+        title_text = self.__render_hud_label(36, "New Cards Unlocked!", Config.WHITE_COLOR)
+        title_rect = title_text.get_rect(centerx=screen_width//2, top=y_pos + 20)
+        self.screen.blit(title_text, title_rect)
+        
+        # Display list of unlocked cards with descriptions
+        y_offset = 80
+        
+        for i, card_info in enumerate(self.new_cards):
+            card_type = card_info['type']
+            card_name = card_info['name']
+            
+            # Card name with type
+            card_text = self.__render_hud_label(24, f"{card_type}: {card_name}", Config.WHITE_COLOR)
+            card_rect = card_text.get_rect(centerx=screen_width//2, top=y_pos + y_offset)
+            self.screen.blit(card_text, card_rect)
+            
+            # Card description
+            if card_type in _CARD_DESCRIPTIONS and card_name in _CARD_DESCRIPTIONS[card_type]:
+                desc_text = self.__render_hud_label(16, _CARD_DESCRIPTIONS[card_type][card_name], (200, 200, 200))
+                desc_rect = desc_text.get_rect(centerx=screen_width//2, top=y_pos + y_offset + 30)
+                self.screen.blit(desc_text, desc_rect)
                 
-            # Display hint
-            font_hint = pygame.font.Font("font/PixelifySans-SemiBold.ttf", 18)
-            hint_text = font_hint.render("Press SPACE to start new game", True, Config.WHITE_COLOR)
-            hint_rect = hint_text.get_rect(centerx=screen_width//2, bottom=y_pos + notification_height - 20)
-            self.screen.blit(hint_text, hint_rect)
+            y_offset += 70  # Increased spacing between cards
             
-        except Exception as e:
-            print(f"Error drawing new cards notification: {e}")
-            # Continue without crashing
+        # Display hint
+        hint_text = self.__render_hud_label(18, "Press SPACE to start new game", Config.WHITE_COLOR)
+        hint_rect = hint_text.get_rect(centerx=screen_width//2, bottom=y_pos + notification_height - 20)
+        self.screen.blit(hint_text, hint_rect)
     
     def update_level_buttons(self):
         """
@@ -1233,7 +1366,7 @@ class GameManager:
                 return
                 
             # หยุดอัลกอริทึมที่กำลังทำงานอยู่
-            if hasattr(self, 'current_algorithm') and self.current_algorithm:
+            if self.current_algorithm is not None:
                 print("[GameManager] Stopping current algorithm due to level change")
                 self.current_algorithm.stop()
                 self.current_algorithm = None
@@ -1268,7 +1401,7 @@ class GameManager:
             self.costmap.reset()
             
             # อัปเดตปุ่มตามสถานะปัจจุบัน
-            if current_state == GameStateEnum.PLAYING.value:
+            if current_state == _STATE_PLAYING:
                 # ถ้าอยู่ในโหมด PLAYING ให้ซ่อนปุ่มทั้งหมด (ยกเว้นปุ่มเลือกด่าน)
                 for button in self.stage.buttons:
                     if not hasattr(button, 'is_level_button') or not button.is_level_button:
@@ -1301,7 +1434,7 @@ class GameManager:
                 return False
             
             # หยุดอัลกอริทึมที่กำลังทำงานอยู่
-            if hasattr(self, 'current_algorithm') and self.current_algorithm:
+            if self.current_algorithm is not None:
                 print("[GameManager] Stopping current algorithm due to level change")
                 self.current_algorithm.stop()
                 self.current_algorithm = None
@@ -1371,7 +1504,7 @@ class GameManager:
             self.costmap.reset()
             
             # อัปเดตปุ่มตามสถานะปัจจุบัน
-            if current_state == GameStateEnum.PLAYING.value:
+            if current_state == _STATE_PLAYING:
                 # ถ้าอยู่ในโหมด PLAYING ให้ซ่อนปุ่มทั้งหมด (ยกเว้นปุ่มเลือกด่าน)
                 for button in self.stage.buttons:
                     if not hasattr(button, 'is_level_button') or not button.is_level_button:
@@ -1395,19 +1528,46 @@ class GameManager:
             # Continue without crashing
             return False
     
+    def __is_animating(self):
+        """
+        Check whether the screen changes without any input.
+        
+        Returns:
+            bool: True if something on screen is moving or counting
+        """
+        return (self.game_state.get_state() == _STATE_LOGIN  # Cursor blink
+                or self.camera_animating
+                or self.should_auto_start
+                or self.new_cards_notification
+                or self.statistics.is_timing
+                or self.current_algorithm is not None
+                or self.card_deck.is_animating())  # Drag, preview hover bob, preview transition
+    
     def run(self):
         """Run the main game loop."""
-        while self.running:
-            try:
+        dt = 1 / 60
+        try:
+            while self.running:
                 self.handle_events()
-                self.update()
-                self.draw()
-                self.clock.tick(60)
-            except Exception as e:
-                print(f"Error in game loop: {e}")
-                # Continue without crashing
-        
-        pygame.quit()
+                # Window minimized: nothing is visible, so keep the game logic ticking
+                # slowly (algorithm steps are 0.2s apart) and sleep instead of drawing
+                if not pygame.display.get_active():
+                    self.update(dt)
+                    self._needs_redraw = True
+                    pygame.time.wait(100)
+                    dt = min(self.clock.tick() / 1000.0, 0.1)
+                    continue
+                # Also redraw on the frame an animation finishes so its final state is shown
+                was_animating = self.__is_animating()
+                self.update(dt)
+                if self._needs_redraw or was_animating or self.__is_animating():
+                    self.draw()
+                    self._needs_redraw = False
+                # Clamp so a long stall (e.g. the statistics window) does not snap the camera
+                dt = min(self.clock.tick(60) / 1000.0, 0.1)
+        finally:
+            # Errors surface with their traceback instead of being swallowed every frame
+            pygame.quit()
 
     def __show_reset_warning(self):
         """แสดงข้อความเตือนว่าหุ่นยนต์ถูก reset"""
@@ -1445,27 +1605,13 @@ class GameManager:
             # ดึงค่าระดับปัจจุบัน
             current_level = self.game_state.get_current_level()
             
-            # อ่านข้อมูลจาก levels.csv
-            import csv
-            level_data = None
-            levels_csv_path = os.path.join("data", "levels.csv")
-            
-            if os.path.exists(levels_csv_path):
-                with open(levels_csv_path, 'r') as csvfile:
-                    csv_reader = csv.DictReader(csvfile)
-                    for row in csv_reader:
-                        map_level = row['map'].replace('map', '').replace('.pgm', '')
-                        try:
-                            if int(map_level) == current_level:
-                                level_data = row
-                                break
-                        except ValueError:
-                            continue
+            # Settings parsed from levels.csv at startup
+            level_data = self.level_settings.get(current_level)
             
             # ถ้าพบข้อมูลใน levels.csv
             if level_data:
-                start_row = int(level_data['start_row'])
-                start_col = int(level_data['start_col'])
+                start_row = level_data['start_row']
+                start_col = level_data['start_col']
                 correct_start_pos = (start_row, start_col)
                 
                 # ตรวจสอบว่า start_pos ที่ตั้งไว้ถูกต้องหรือไม่
@@ -1488,8 +1634,8 @@ class GameManager:
                     print(f"[GameManager] Robot reset to correct start position: {correct_start_pos}")
                 
                 # ตรวจสอบว่าเป้าหมายถูกต้องหรือไม่
-                finish_row = int(level_data['finish_row'])
-                finish_col = int(level_data['finish_col'])
+                finish_row = level_data['finish_row']
+                finish_col = level_data['finish_col']
                 correct_goal_pos = (finish_row, finish_col)
                 
                 if hasattr(self.costmap, 'goal_pos') and self.costmap.goal_pos != correct_goal_pos:
@@ -1499,9 +1645,7 @@ class GameManager:
                     print(f"[GameManager] Goal reset to correct position: {correct_goal_pos}")
                 
                 # ตรวจสอบว่าค่า time_limit ถูกต้องหรือไม่
-                time_limit_str = level_data['time_limit']
-                time_limit_value = ''.join(c for c in time_limit_str if c.isdigit())
-                time_limit = int(time_limit_value)
+                time_limit = level_data['time_limit']
                 if self.statistics.time_limit != time_limit:
                     print(f"[GameManager] Incorrect time limit detected: {self.statistics.time_limit}, should be {time_limit}")
                     # แก้ไขค่า time_limit ให้ถูกต้อง
@@ -1538,28 +1682,12 @@ class GameManager:
             # Get current level number
             current_level = self.game_state.get_current_level()
             
-            # Read data from levels.csv
-            import csv
-            level_data = None
-            levels_csv_path = os.path.join("data", "levels.csv")
-            
-            if os.path.exists(levels_csv_path):
-                with open(levels_csv_path, 'r') as csvfile:
-                    csv_reader = csv.DictReader(csvfile)
-                    for row in csv_reader:
-                        map_level = row['map'].replace('map', '').replace('.pgm', '')
-                        try:
-                            if int(map_level) == current_level:
-                                level_data = row
-                                break
-                        except ValueError:
-                            continue
+            # Settings parsed from levels.csv at startup
+            level_data = self.level_settings.get(current_level)
             
             # If we have data from levels.csv, set time limit
             if level_data:
-                time_limit_str = level_data['time_limit']
-                time_limit_value = ''.join(c for c in time_limit_str if c.isdigit())
-                time_limit = int(time_limit_value)
+                time_limit = level_data['time_limit']
                 if self.statistics.time_limit != time_limit:
                     print(f"[GameManager] Incorrect time limit detected: {self.statistics.time_limit}, should be {time_limit}")
                     # Update time limit
@@ -1581,30 +1709,12 @@ class GameManager:
             # Get current level number
             current_level = self.game_state.get_current_level()
             
-            # Read data from levels.csv
-            import csv
-            level_data = None
-            levels_csv_path = os.path.join("data", "levels.csv")
-            
-            if os.path.exists(levels_csv_path):
-                with open(levels_csv_path, 'r') as csvfile:
-                    csv_reader = csv.DictReader(csvfile)
-                    for row in csv_reader:
-                        map_level = row['map'].replace('map', '').replace('.pgm', '')
-                        try:
-                            if int(map_level) == current_level:
-                                level_data = row
-                                break
-                        except ValueError:
-                            continue
+            # Settings parsed from levels.csv at startup
+            level_data = self.level_settings.get(current_level)
             
             # If we have data from levels.csv, return time limit
             if level_data:
-                # ตรวจสอบและแปลงค่า time_limit ที่มีหน่วยเวลาต่อท้าย
-                time_limit_str = level_data['time_limit']
-                # ตัดตัวอักษรออกจากตัวเลข (เช่น '10s' เป็น '10')
-                time_limit_value = ''.join(c for c in time_limit_str if c.isdigit())
-                return int(time_limit_value)
+                return level_data['time_limit']
             else:
                 print(f"[GameManager] Warning: No data found for level {current_level} in levels.csv")
                 return None
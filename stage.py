@@ -5,6 +5,19 @@ import pygame
 from typing import List, Tuple, Optional
 from card import Card, CardType
 from config import Config
+from algorithms.navigation import NAVIGATION_ALGORITHMS
+from algorithms.collision_avoidance import COLLISION_AVOIDANCE_ALGORITHMS
+from algorithms.recovery import RECOVERY_ALGORITHMS
+
+_slot_log = Config.logger_for("CardSlot")
+_stage_log = Config.logger_for("Stage")
+
+# Algorithm registry per card type
+_ALGORITHM_TABLES = {
+    "Navigation": NAVIGATION_ALGORITHMS,
+    "Collision avoidance": COLLISION_AVOIDANCE_ALGORITHMS,
+    "Recovery": RECOVERY_ALGORITHMS,
+}
 
 class Button:
     """
@@ -42,6 +55,8 @@ class Button:
             else:
                 # ปุ่มอื่นๆ ยังคงมีขนาดใหญ่
                 self.image = pygame.transform.scale(self.image, (250, 150))
+            if pygame.display.get_surface() is not None:
+                self.image = self.image.convert_alpha()
         except pygame.error:
             self.image = pygame.Surface((100, 50))
             self.image.fill((150, 150, 150))
@@ -54,6 +69,10 @@ class Button:
         self.is_hovered = False
         self.is_visible = True
         
+        # ภาพขยายตอนเมาส์ชี้ สร้างครั้งเดียวแทนการ scale ทุกเฟรม
+        self.hover_image = pygame.transform.scale(
+            self.image, (int(self.rect.width * 1.25), int(self.rect.height * 1.25)))
+        
     def set_visible(self, visible: bool):
         """
         Set the visibility of the button.
@@ -75,23 +94,16 @@ class Button:
             return
         
         # สำหรับปุ่มเปลี่ยนระดับ ไม่ต้องปรับ offset ตามกล้อง
-        if hasattr(self, 'is_level_button') and self.is_level_button:
+        if self.is_level_button:
             # ปุ่มเปลี่ยนระดับแสดงในตำแหน่งปกติ
-            draw_rect = self.rect.copy()
+            draw_rect = self.rect
         else:
             # ปุ่มอื่นๆ ปรับตำแหน่งตามกล้อง
-            draw_rect = self.rect.copy()
-            draw_rect.center = (self.rect.centerx + camera_offset[0], self.rect.centery + camera_offset[1])
+            draw_rect = self.rect.move(camera_offset)
             
         if self.is_hovered:
-            # คำนวณขนาดใหม่เมื่อเมาส์ชี้
-            scaled_width = int(self.rect.width * 1.25)
-            scaled_height = int(self.rect.height * 1.25)
-            scaled_image = pygame.transform.scale(self.image, (scaled_width, scaled_height))
-            
-            # สร้าง rect ใหม่สำหรับภาพที่ขยาย
-            scaled_rect = scaled_image.get_rect(center=draw_rect.center)
-            screen.blit(scaled_image, scaled_rect)
+            # ใช้ภาพขยายที่สร้างไว้แล้ว จัดให้อยู่กึ่งกลางตำแหน่งเดิม
+            screen.blit(self.hover_image, self.hover_image.get_rect(center=draw_rect.center))
         else:
             screen.blit(self.image, draw_rect)
     
@@ -275,8 +287,9 @@ class CardSlot:
         Returns:
             bool: True if card can be placed, False otherwise
         """
-        print(f"[CardSlot] Checking if can accept card: {card.card_type} - {card.card_name}")
-        print(f"[CardSlot] Slot type: {self.card_type.value}")
+        # Called from draw() every frame while dragging, so only log at verbose level
+        if Config.LOG_LEVEL >= 3:
+            _slot_log(f"Checking if can accept card: {card.card_type} - {card.card_name} (slot type: {self.card_type.value})", level=3)
         return card.card_type == self.card_type.value
 
     def place_card(self, card: Card) -> bool:
@@ -289,13 +302,13 @@ class CardSlot:
             bool: True if card was placed successfully, False otherwise
         """
         if not self.can_accept_card(card):
-            print(f"[CardSlot] Cannot place card: {card.card_type} - {card.card_name} in slot: {self.card_type.value}")
+            _slot_log(f"Cannot place card: {card.card_type} - {card.card_name} in slot: {self.card_type.value}")
             return False
             
         # If there's an existing card, return the old card to the deck
         removed_card = None
         if self.card is not None:
-            print(f"[CardSlot] Returning old card: {self.card.card_name} to deck")
+            _slot_log(f"Returning old card: {self.card.card_name} to deck")
             removed_card = self.card
             removed_card.current_area = "deck"
             removed_card.position = removed_card.original_position
@@ -303,7 +316,7 @@ class CardSlot:
             self.card = None  # Remove old card from slot before returning
             
         # Place new card
-        print(f"[CardSlot] Placing new card: {card.card_name} in slot: {self.card_type.value}")
+        _slot_log(f"Placing new card: {card.card_name} in slot: {self.card_type.value}", level=3)
         self.card = card
         
         # Set card position to center of slot
@@ -343,6 +356,10 @@ class Stage:
             for x in range(0, Config.BOARD_WIDTH, 50):
                 pygame.draw.circle(surface, (0, 100, 0), (x, y), 2)
         
+        # แปลงเป็น pixel format ของหน้าจอ เพื่อให้ blit ทุกเฟรมเป็นการคัดลอกตรงๆ
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        
         return surface
     
     def _initialize_buttons(self) -> List[Button]:
@@ -503,7 +520,7 @@ class Stage:
             if button.is_visible:
                 # ตรวจสอบว่าการคลิกอยู่ในปุ่มหรือไม่
                 if button.rect.collidepoint(mouse_pos):
-                    print(f"[Stage] Button clicked: {button.action_name}")
+                    _stage_log(f"Button clicked: {button.action_name}")
                     return button.action_name
         
         return None
@@ -522,7 +539,7 @@ class Stage:
         # Adjust position considering camera offset
         adjusted_position = (position[0] - camera_offset[0], position[1] - camera_offset[1])
         
-        print(f"[Stage] Attempting to place card at position: {adjusted_position}")
+        _stage_log(f"Attempting to place card at position: {adjusted_position}", level=3)
         
         # Find slot at the adjusted position
         for slot in self.slots:
@@ -533,7 +550,7 @@ class Stage:
             )
             
             if slot_rect.collidepoint(adjusted_position):
-                print(f"[Stage] Found slot at position: {slot.position} for card type: {slot.card_type.value}")
+                _stage_log(f"Found slot at position: {slot.position} for card type: {slot.card_type.value}", level=3)
                 result = slot.place_card(card)
                 
                 if result:
@@ -546,11 +563,11 @@ class Stage:
                     
                     # Update slot rect
                     card.rect.center = card.position
-                    print(f"[Stage] Card successfully placed at {card.position}")
+                    _stage_log(f"Card successfully placed at {card.position}", level=3)
                 
                 return result
                 
-        print("[Stage] No valid slot found at position")
+        _stage_log("No valid slot found at position", level=3)
         return False
 
     def get_slot_at_position(self, pos: Tuple[int, int]) -> Optional[CardSlot]:
@@ -559,6 +576,18 @@ class Stage:
                 return slot
         return None
 
+    def clear_slots(self) -> List[Tuple[CardSlot, Card]]:
+        """
+        Remove every card from the slots in one pass
+        
+        Returns:
+            List[Tuple[CardSlot, Card]]: (slot, card) pairs that were cleared
+        """
+        cleared = [(slot, slot.card) for slot in self.slots if slot.card is not None]
+        for slot, _ in cleared:
+            slot.card = None
+        return cleared
+
     def get_selected_algorithm(self):
         """
         Get the algorithm selected by the player
@@ -622,19 +651,8 @@ class Stage:
         selected_card = algorithm_cards[0]
         print(f"Using algorithm: {selected_card.card_name} ({selected_card.card_type})")
         
-        # Import algorithm modules
-        from algorithms.navigation import NAVIGATION_ALGORITHMS
-        from algorithms.collision_avoidance import COLLISION_AVOIDANCE_ALGORITHMS
-        from algorithms.recovery import RECOVERY_ALGORITHMS
-        
         # Find algorithm class based on card type and name
-        algorithm_class = None
-        if selected_card.card_type == "Navigation":
-            algorithm_class = NAVIGATION_ALGORITHMS.get(selected_card.card_name)
-        elif selected_card.card_type == "Collision avoidance":
-            algorithm_class = COLLISION_AVOIDANCE_ALGORITHMS.get(selected_card.card_name)
-        elif selected_card.card_type == "Recovery":
-            algorithm_class = RECOVERY_ALGORITHMS.get(selected_card.card_name)
+        algorithm_class = _ALGORITHM_TABLES.get(selected_card.card_type, {}).get(selected_card.card_name)
             
         if not algorithm_class:
             print(f"Algorithm not found for card: {selected_card.card_name}")
@@ -0,0 +1,26 @@
+"""
+Shared pytest setup: run headless from the repository root.
+"""
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Assets, fonts and data are loaded with paths relative to the repository root
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+@pytest.fixture
+def pygame_display(monkeypatch):
+    """Initialize pygame with a small dummy display."""
+    pygame = pytest.importorskip("pygame")
+    monkeypatch.chdir(REPO_ROOT)
+    pygame.init()
+    pygame.display.set_mode((1280, 720))
+    yield pygame
+    pygame.quit()
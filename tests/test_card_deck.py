@@ -0,0 +1,34 @@
+"""
+Tests for CardDeck.
+"""
+import pytest
+
+pytest.importorskip("pygame")
+
+
+def test_fresh_deck_is_not_animating(pygame_display):
+    """A freshly dealt deck with nothing dragged lets the game loop skip idle frames."""
+    from cardDeck import CardDeck
+    
+    deck = CardDeck(stage=None)
+    
+    assert deck.cards
+    assert deck.dragging_card is None
+    assert deck.is_animating() is False
+
+
+def test_hovered_preview_card_is_animating(pygame_display):
+    """The hovered card bobs with time in preview mode, so frames must keep drawing."""
+    from cardDeck import CardDeck
+    from config import Config
+    
+    deck = CardDeck(stage=None)
+    deck.handle_events([pygame_display.event.Event(pygame_display.KEYDOWN, key=pygame_display.K_SPACE)])
+    assert deck.is_animating() is False
+    
+    deck.cards[0].hover_scale = Config.PREVIEW_HOVER_SCALE
+    assert deck.is_animating() is True
+    
+    # Leaving preview mode stops the bob
+    deck.handle_events([pygame_display.event.Event(pygame_display.KEYDOWN, key=pygame_display.K_SPACE)])
+    assert deck.is_animating() is False
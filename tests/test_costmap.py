@@ -0,0 +1,159 @@
+"""
+Tests for Costmap.
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pygame")
+
+RECTS = [
+    (0, 0, 3, 2),       # Corner
+    (5, 40, 10, 4),     # Runs past the right edge
+    (20, 10, 2, 10),    # Runs past the bottom edge
+    (8, 8, 0, 3),       # Zero width
+    (8, 12, -2, 3),     # Negative width
+    (-1, 5, 3, 3),      # Start row out of bounds
+    (4, 45, 2, 2),      # Start col out of bounds
+]
+
+CIRCLES = [
+    (11, 22, 4),        # Fully inside
+    (0, 0, 3),          # Clipped at the corner
+    (22, 44, 2),        # Clipped at the opposite corner
+    (15, 30, 0),        # Single cell
+    (15, 35, -3),       # Negative radius
+    (23, 10, 2),        # Center row out of bounds
+    (5, -1, 2),         # Center col out of bounds
+]
+
+
+def _empty_costmap():
+    from costmap import Costmap
+    
+    costmap = Costmap()
+    costmap.clear_grid()
+    return costmap
+
+
+def test_batch_matches_single_obstacle_methods(pygame_display):
+    """add_obstacles_batch marks the same cells as the per-obstacle methods."""
+    single = _empty_costmap()
+    for rect in RECTS:
+        single.add_rectangle_obstacle(*rect)
+    for circle in CIRCLES:
+        single.add_circular_obstacle(*circle)
+    
+    batch = _empty_costmap()
+    batch.add_obstacles_batch(rects=RECTS, circles=CIRCLES)
+    
+    assert single.grid.any()
+    np.testing.assert_array_equal(batch.grid, single.grid)
+
+
+def test_batch_skips_negative_radius(pygame_display):
+    """A circle with a negative radius leaves the grid untouched."""
+    costmap = _empty_costmap()
+    costmap.add_obstacles_batch(circles=[(11, 22, -4)])
+    
+    assert not costmap.grid.any()
+
+
+def _assert_bits_in_sync(costmap):
+    np.testing.assert_array_equal(costmap.grid_bits, np.packbits(costmap.grid, axis=1))
+
+
+def test_grid_bits_follow_every_writer(pygame_display):
+    """grid_bits stays equal to np.packbits(grid, axis=1) after each grid writer."""
+    costmap = _empty_costmap()
+    _assert_bits_in_sync(costmap)
+    
+    costmap.set_cell(3, 9, 1)
+    _assert_bits_in_sync(costmap)
+    costmap.set_cell(3, 9, 0)
+    _assert_bits_in_sync(costmap)
+    costmap.set_cell(22, 44, 1)
+    _assert_bits_in_sync(costmap)
+    
+    costmap.add_rectangle_obstacle(5, 40, 10, 4)
+    _assert_bits_in_sync(costmap)
+    costmap.add_circular_obstacle(11, 22, 4)
+    _assert_bits_in_sync(costmap)
+    costmap.add_obstacles_batch(rects=RECTS, circles=CIRCLES)
+    _assert_bits_in_sync(costmap)
+    
+    costmap.clear_grid()
+    _assert_bits_in_sync(costmap)
+    costmap.reset_demo_map()
+    _assert_bits_in_sync(costmap)
+    assert costmap.load_pgm_map("data/map1.pgm")
+    _assert_bits_in_sync(costmap)
+
+
+def test_obstacle_queries_match_brute_force(pygame_display):
+    """row_has_obstacle and region_has_obstacle agree with scanning the grid."""
+    costmap = _empty_costmap()
+    costmap.add_obstacles_batch(rects=RECTS, circles=CIRCLES)
+    
+    for row in range(costmap.grid_height):
+        assert costmap.row_has_obstacle(row) == bool(costmap.grid[row].any())
+    
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        start_row, end_row = sorted(rng.integers(0, costmap.grid_height + 1, size=2))
+        start_col, end_col = sorted(rng.integers(0, costmap.grid_width + 1, size=2))
+        expected = bool(costmap.grid[start_row:end_row, start_col:end_col].any())
+        assert costmap.region_has_obstacle(start_row, end_row, start_col, end_col) == expected
+
+
+def test_circle_template_matches_circular_obstacle(pygame_display):
+    """The footprint template covers the same cells add_circular_obstacle fills."""
+    from costmap import Costmap
+    
+    for radius in range(0, 5):
+        costmap = _empty_costmap()
+        costmap.add_circular_obstacle(11, 22, radius)
+        template = Costmap.make_circle_template(radius)
+        
+        assert len(template) == int(costmap.grid.sum())
+        assert costmap.grid[template[:, 0] + 11, template[:, 1] + 22].all()
+
+
+def test_footprint_collides(pygame_display):
+    """Footprints collide with obstacles and the grid edge, never with a negative radius."""
+    from costmap import Costmap
+    
+    costmap = _empty_costmap()
+    costmap.set_cell(11, 25, 1)
+    
+    assert costmap.footprint_collides(11, 22, 3)
+    assert not costmap.footprint_collides(11, 22, 2)
+    assert costmap.footprint_collides(1, 22, 2)  # Runs off the top edge
+    
+    assert len(Costmap.make_circle_template(-2)) == 0
+    assert not costmap.footprint_collides(11, 22, -2)
+
+
+def test_line_of_sight(pygame_display):
+    """line_of_sight walks every cell between the endpoints, endpoints included."""
+    costmap = _empty_costmap()
+    
+    # Clear lines: horizontal, vertical, diagonal and a single cell
+    assert costmap.line_of_sight((2, 2), (2, 40))
+    assert costmap.line_of_sight((2, 2), (20, 2))
+    assert costmap.line_of_sight((2, 2), (12, 12))
+    assert costmap.line_of_sight((5, 5), (5, 5))
+    
+    # An obstacle on the diagonal blocks it in both directions
+    costmap.set_cell(7, 7, 1)
+    assert not costmap.line_of_sight((2, 2), (12, 12))
+    assert not costmap.line_of_sight((12, 12), (2, 2))
+    assert costmap.line_of_sight((2, 3), (12, 13))
+    
+    # Occupied endpoints block the line
+    assert not costmap.line_of_sight((7, 7), (7, 20))
+    assert not costmap.line_of_sight((7, 20), (7, 7))
+    
+    # Endpoints outside the grid never have line of sight
+    assert not costmap.line_of_sight((-1, 3), (5, 3))
+    assert not costmap.line_of_sight((5, 3), (5, costmap.grid_width))
+    assert not costmap.line_of_sight((costmap.grid_height, 0), (0, 0))